@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Art View Module
+This module provides a virtualized ASCII art preview for the ASCII Converter application.
+
+Documents produce the text of any line and column range on demand, and the view
+only draws the lines and columns currently visible, so scrolling and resizing
+cost the same whatever the document size.
+"""
+import tkinter as tk
+from bisect import bisect_right
+from itertools import accumulate
+from tkinter import font as tkfont
+from tkinter import ttk
+from constants import COLORS
+
+
+class LinesDocument:
+    """Document over lines that are already in memory, e.g. converted from an image."""
+
+    def __init__(self, lines, pattern_char='*'):
+        self.lines = list(lines)
+        self.pattern_char = pattern_char
+        self.line_count = len(self.lines)
+        self.width = max((len(line) for line in self.lines), default=0)
+
+    def line_slice(self, row, start, end):
+        """Return columns [start, end) of a line."""
+        return self.lines[row][start:end]
+
+    def iter_lines(self):
+        """Yield every line of the document."""
+        return iter(self.lines)
+
+
+class ArtDocument:
+    """
+    Lazily rendered ASCII art for a text, laid out like ASCIIArt.iter_art.
+
+    Building the document only measures glyph widths; glyph rows are rendered
+    when a line slice is requested, and only for the characters inside it.
+    """
+
+    def __init__(self, generator, text, pattern_char='*', width=None):
+        """
+        Args:
+            generator (ASCIIArt): Generator whose glyph atlas renders the art
+            text (str): Text to render; newlines start a new block of art lines
+            pattern_char (str, optional): Character to use for patterns. Defaults to '*'.
+            width (int, optional): Wrap blocks at this many columns, or None to not wrap.
+        """
+        self.text = text
+        self.pattern_char = pattern_char
+        self.render = generator.atlas.render
+        self.height = generator.atlas.height
+
+        # Blocks as (start, end) ranges of text, with the starting column of every glyph
+        self.blocks = []
+        self._columns = []
+        for start, end in self._split_blocks(text, width):
+            widths = [len(self.render(pattern_char, char)[0]) + 1 for char in text[start:end]]
+            self.blocks.append((start, end))
+            self._columns.append([0] + list(accumulate(widths)))
+
+        # Blocks are separated by an empty line, as in iter_art
+        self.line_count = max(0, len(self.blocks) * (self.height + 1) - 1)
+        self.width = max((columns[-1] - 1 for columns in self._columns), default=0)
+
+    def _split_blocks(self, text, width):
+        """Yield (start, end) ranges of the blocks of text, wrapped to width columns."""
+        start = 0
+        for line in text.split('\n'):
+            end = start + len(line)
+            if not line:
+                start = end + 1
+                continue
+            block_start, block_width = start, -1
+            for index in range(start, end):
+                glyph_width = len(self.render(self.pattern_char, text[index])[0]) + 1
+                if width is not None and index > block_start and block_width + glyph_width > width:
+                    yield block_start, index
+                    block_start, block_width = index, -1
+                block_width += glyph_width
+            yield block_start, end
+            start = end + 1
+
+    def line_slice(self, row, start, end):
+        """
+        Render columns [start, end) of one art line.
+
+        Args:
+            row (int): Line number
+            start (int): First column
+            end (int): Column after the last one
+
+        Returns:
+            str: Text of the line within the column range (shorter at the line end)
+        """
+        block, glyph_row = divmod(row, self.height + 1)
+        if glyph_row == self.height or start >= end:
+            return ''
+
+        block_start, block_end = self.blocks[block]
+        columns = self._columns[block]
+        count = block_end - block_start
+        first = bisect_right(columns, start) - 1
+        if first >= count:
+            return ''
+
+        pieces = []
+        index = first
+        while index < count and columns[index] < end:
+            pieces.append(self.render(self.pattern_char, self.text[block_start + index])[glyph_row])
+            index += 1
+        # Keep the separator column before a glyph starting exactly at the range end
+        segment = ' '.join(pieces) + (' ' if index < count else '')
+        offset = start - columns[first]
+        return segment[offset:offset + end - start]
+
+    def iter_lines(self):
+        """Yield every line of the document."""
+        for row in range(self.line_count):
+            yield self.line_slice(row, 0, self.width)
+
+
+class VirtualArtView(ttk.Frame):
+    """
+    Scrollable preview that draws only the visible part of a document on a Canvas.
+
+    One canvas text item is kept per visible line and refilled with the visible
+    column range on every scroll, resize or document change.
+    """
+
+    def __init__(self, parent, font_size=10, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.document = LinesDocument([])
+        self.top_row = 0
+        self.left_column = 0
+        self._items = []
+
+        self.canvas = tk.Canvas(self,
+                                width=440,
+                                height=200,
+                                bg=COLORS['bg'],
+                                highlightthickness=1,
+                                highlightbackground=COLORS['text'])
+        self.y_scrollbar = ttk.Scrollbar(self, command=self.yview)
+        self.x_scrollbar = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.xview)
+
+        self.y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.canvas.pack(expand=True, fill=tk.BOTH)
+
+        self.set_font_size(font_size)
+
+        self.canvas.bind('<Configure>', lambda event: self.redraw())
+        self.canvas.bind('<MouseWheel>', self._on_mouse_wheel)
+        self.canvas.bind('<Shift-MouseWheel>', self._on_shift_mouse_wheel)
+        self.canvas.bind('<Button-4>', lambda event: self.yview('scroll', -3, 'units'))
+        self.canvas.bind('<Button-5>', lambda event: self.yview('scroll', 3, 'units'))
+
+    def set_font_size(self, font_size):
+        """Change the preview font; only the visible lines are redrawn."""
+        self.font = tkfont.Font(family='Courier', size=font_size)
+        self.char_width = max(1, self.font.measure('M'))
+        self.line_height = max(1, self.font.metrics('linespace'))
+        for item in self._items:
+            self.canvas.itemconfigure(item, font=self.font)
+        self.redraw()
+
+    def set_document(self, document):
+        """Show a document, keeping the scroll position where possible."""
+        self.document = document
+        self.redraw()
+
+    def clear(self):
+        """Show an empty preview."""
+        self.top_row = self.left_column = 0
+        self.set_document(LinesDocument([]))
+
+    def visible_size(self):
+        """Return the number of (rows, columns) that fit in the canvas."""
+        return (max(1, self.canvas.winfo_height() // self.line_height),
+                max(1, self.canvas.winfo_width() // self.char_width))
+
+    def redraw(self):
+        """Draw the visible window of the document."""
+        rows, columns = self.visible_size()
+        document = self.document
+        self.top_row = max(0, min(self.top_row, document.line_count - rows))
+        self.left_column = max(0, min(self.left_column, document.width - columns))
+
+        # One extra line and column so partially visible cells are drawn too
+        while len(self._items) < rows + 1:
+            self._items.append(self.canvas.create_text(0, 0, anchor='nw', font=self.font,
+                                                       fill=COLORS['text']))
+        for index, item in enumerate(self._items):
+            row = self.top_row + index
+            text = ''
+            if index <= rows and row < document.line_count:
+                text = document.line_slice(row, self.left_column, self.left_column + columns + 1)
+            self.canvas.coords(item, 2, 2 + index * self.line_height)
+            self.canvas.itemconfigure(item, text=text)
+
+        self.y_scrollbar.set(*self._fractions(self.top_row, rows, document.line_count))
+        self.x_scrollbar.set(*self._fractions(self.left_column, columns, document.width))
+
+    @staticmethod
+    def _fractions(first, visible, total):
+        if total <= 0:
+            return 0.0, 1.0
+        return first / total, min(1.0, (first + visible) / total)
+
+    def _scroll(self, position, visible, total, args):
+        """Apply a Tk scroll command ('moveto' or 'scroll') to a position."""
+        if args[0] == 'moveto':
+            return int(float(args[1]) * total)
+        amount = int(args[1])
+        return position + (amount * visible if args[2] == 'pages' else amount)
+
+    def yview(self, *args):
+        """Vertical scroll command for scrollbars and key bindings."""
+        rows, _ = self.visible_size()
+        if not args:
+            return self._fractions(self.top_row, rows, self.document.line_count)
+        self.top_row = self._scroll(self.top_row, rows, self.document.line_count, args)
+        self.redraw()
+
+    def xview(self, *args):
+        """Horizontal scroll command for scrollbars and key bindings."""
+        _, columns = self.visible_size()
+        if not args:
+            return self._fractions(self.left_column, columns, self.document.width)
+        self.left_column = self._scroll(self.left_column, columns, self.document.width, args)
+        self.redraw()
+
+    def _on_mouse_wheel(self, event):
+        self.yview('scroll', -1 if event.delta > 0 else 1, 'units')
+
+    def _on_shift_mouse_wheel(self, event):
+        self.xview('scroll', -8 if event.delta > 0 else 8, 'units')
@@ -3,56 +3,228 @@
 ASCII Art Module
 This module provides ASCII art patterns and functionality for the ASCII Converter application.
 """
+import unicodedata
+from collections.abc import Mapping
+from functools import lru_cache
+from itertools import chain
+from profiling import stage
+
+# Glyph source patterns using the '1' character - replaced with the selected pattern character
+ART_PATTERNS = {
+    'A': ["  1  ", " 1 1 ", "11111", "1   1"],
+    'B': ["1111 ", "1   1", "1111 ", "1   1", "1111 "],
+    'C': [" 111 ", "1    ", "1    ", "1    ", " 111 "],
+    'D': ["1111 ", "1   1", "1   1", "1   1", "1111 "],
+    'E': ["11111", "1    ", "111  ", "1    ", "11111"],
+    'F': ["11111", "1    ", "111  ", "1    ", "1    "],
+    'G': [" 111 ", "1    ", "1  11", "1   1", " 111 "],
+    'H': ["1   1", "1   1", "1   1", "1   1"],
+    'I': ["11111", "  1  ", "  1  ", "  1  ", "11111"],
+    'J': ["11111", "   1 ", "   1 ", "1  1 ", " 11  "],
+    'K': ["1  1 ", "1 1  ", "11   ", "1 1  ", "1  1 "],
+    'L': ["1    ", "1    ", "1    ", "1    ", "11111"],
+    'M': ["1   1", "11 11", "1 1 1", "1   1", "1   1"],
+    'N': ["1   1", "11  1", "1 1 1", "1  11", "1   1"],
+    'O': [" 111 ", "1   1", "1   1", "1   1", " 111 "],
+    'P': ["1111 ", "1   1", "1111 ", "1    ", "1    "],
+    'Q': [" 111 ", "1   1", "1   1", "1  11", " 1111"],
+    'R': ["1111 ", "1   1", "1  1 ", "1   1"],
+    'S': [" 111 ", "1    ", " 111 ", "    1", " 111 "],
+    'T': ["11111", "  1  ", "  1  ", "  1  ", "  1  "],
+    'U': ["1   1", "1   1", "1   1", "1   1", " 111 "],
+    'V': ["1   1", "1   1", "1   1", " 1 1 ", "  1  "],
+    'W': ["1   1", "1   1", "1 1 1", "11 11", "1   1"],
+    'X': ["1   1", " 1 1 ", "  1  ", " 1 1 ", "1   1"],
+    'Y': ["1   1", " 1 1 ", "  1  ", "  1  ", "  1  "],
+    'Z': ["11111", "   1 ", "  1  ", " 1   ", "11111"],
+    '0': [" 111 ", "1   1", "1   1", "1   1", " 111 "],
+    '1': ["  1  ", " 11  ", "  1  ", "  1  ", "11111"],
+    '2': [" 111 ", "1   1", "  11 ", " 1   ", "11111"],
+    '3': ["1111 ", "    1", "  11 ", "    1", "1111 "],
+    '4': ["   1 ", "  11 ", " 1 1 ", "11111", "   1 "],
+    '5': ["11111", "1    ", "1111 ", "    1", "1111 "],
+    '6': [" 111 ", "1    ", "1111 ", "1   1", " 111 "],
+    '7': ["11111", "    1", "   1 ", "  1  ", " 1   "],
+    '8': [" 111 ", "1   1", " 111 ", "1   1", " 111 "],
+    '9': [" 111 ", "1   1", " 1111", "    1", " 111 "],
+    ' ': ["     ", "     ", "     ", "     ", "     "],
+    '.': ["     ", "     ", "     ", "     ", "  1  "],
+    ',': ["     ", "     ", "     ", "  1  ", " 1   "],
+    '!': ["  1  ", "  1  ", "  1  ", "     ", "  1  "],
+    '?': [" 111 ", "1   1", "  11 ", "     ", "  1  "],
+    '(': ["  1  ", " 1 1 ", "1   1", " 1 1 ", "  1  "],
+    ')': ["  1  ", " 1 1 ", "1   1", " 1 1 ", "  1  "],
+    # Add more characters as needed; other glyph sets go through ASCIIArt(GlyphAtlas(patterns))
+}
+
+# Maximum number of pre-substituted glyphs kept per atlas
+GLYPH_CACHE_SIZE = 4096
+
+# Number of characters read at a time when streaming from a file object
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class GlyphAtlas:
+    """
+    Compiled glyph set with a bounded cache of rendered glyph rows.
+
+    Glyph rows are normalized to a fixed height and stored as integer bitmasks
+    (bit N set means column N is drawn), so the source patterns are parsed once
+    and rendering a cached (pattern_char, char) pair does no string work at all.
+    """
+
+    def __init__(self, patterns, height=None, cache_size=GLYPH_CACHE_SIZE):
+        """
+        Compile glyph patterns into the atlas.
+
+        Args:
+            patterns (dict): Mapping of character to rows drawn with the '1' character
+            height (int, optional): Glyph height. Defaults to the tallest pattern.
+            cache_size (int, optional): Maximum number of cached rendered glyphs.
+        """
+        self.height = height or max(len(rows) for rows in patterns.values())
+        self.glyphs = {char: self.compile_glyph(rows, self.height)
+                       for char, rows in patterns.items()}
+        self.render = lru_cache(maxsize=cache_size)(self._render)
+
+    @classmethod
+    def from_compiled(cls, glyphs, height, cache_size=GLYPH_CACHE_SIZE):
+        """
+        Create an atlas from already compiled glyphs, e.g. loaded from a font cache.
+
+        Args:
+            glyphs (Mapping): Mapping of character to (glyph width, row bitmasks)
+            height (int): Glyph height
+            cache_size (int, optional): Maximum number of cached rendered glyphs.
+
+        Returns:
+            GlyphAtlas: Atlas using the given glyphs as they are
+        """
+        atlas = cls.__new__(cls)
+        atlas.height = height
+        atlas.glyphs = glyphs
+        atlas.render = lru_cache(maxsize=cache_size)(atlas._render)
+        return atlas
+
+    @staticmethod
+    def compile_glyph(rows, height):
+        """
+        Compile pattern rows into a (width, row bitmasks) pair.
+
+        Rows are padded at the bottom with blank rows up to the atlas height.
+
+        Args:
+            rows (list): Pattern rows using '1' for drawn cells
+            height (int): Target glyph height
+
+        Returns:
+            tuple: (glyph width, tuple of row bitmasks)
+        """
+        width = max((len(row) for row in rows), default=0)
+        masks = [sum(1 << col for col, cell in enumerate(row) if cell == '1')
+                 for row in rows[:height]]
+        masks.extend([0] * (height - len(masks)))
+        return width, tuple(masks)
+
+    def resolve(self, char):
+        """
+        Find the atlas character used to draw a character.
+
+        Falls back to the uppercase form, then to the base letter of accented
+        characters (e.g. 'é' is drawn with the 'E' glyph when 'é' is missing).
+
+        Args:
+            char (str): Character to look up
+
+        Returns:
+            str or None: Key into glyphs, or None if the atlas has no matching glyph
+        """
+        for candidate in (char, char.upper()):
+            if candidate in self.glyphs:
+                return candidate
+        base = unicodedata.normalize('NFKD', char)[:1]
+        if base and base != char:
+            for candidate in (base, base.upper()):
+                if candidate in self.glyphs:
+                    return candidate
+        return None
+
+    def lookup(self, char):
+        """
+        Find the compiled glyph for a character (see resolve).
+
+        Args:
+            char (str): Character to look up
+
+        Returns:
+            tuple or None: (glyph width, row bitmasks), or None if the atlas has no glyph
+        """
+        key = self.resolve(char)
+        return None if key is None else self.glyphs[key]
+
+    def placeholder(self, char):
+        """
+        Build the default rows shown for characters missing from the atlas.
+
+        Args:
+            char (str): Character without a glyph
+
+        Returns:
+            tuple: Rows of one common width showing the character and its code point
+        """
+        rows = ["", char.upper(), f"({ord(char)})"][:self.height]
+        # At least as wide as the built-in glyphs, with a blank column on each side
+        width = max(5, max(len(row) for row in rows) + 2)
+        rows = [row.center(width) for row in rows]
+        return tuple(rows + [" " * width] * (self.height - len(rows)))
+
+    def _render(self, pattern_char, char):
+        glyph = self.lookup(char)
+        if glyph is None:
+            return self.placeholder(char)
+
+        width, masks = glyph
+        return tuple("".join(pattern_char if mask >> col & 1 else " " for col in range(width))
+                     for mask in masks)
+
+
+# Built-in atlas, compiled once at import time and shared by all generators
+DEFAULT_ATLAS = GlyphAtlas(ART_PATTERNS)
+
+
+class AtlasPatterns(Mapping):
+    """
+    Read-only view of the glyphs of an atlas as pattern rows drawn with '1'.
+
+    Rows are decoded from the compiled glyphs on access and returned as tuples,
+    so the view always describes the glyphs the atlas draws and cannot change them.
+    """
+
+    def __init__(self, atlas):
+        self.atlas = atlas
+
+    def __getitem__(self, char):
+        if char not in self.atlas.glyphs:
+            raise KeyError(char)
+        return self.atlas.render('1', char)
+
+    def __iter__(self):
+        return iter(self.atlas.glyphs)
+
+    def __len__(self):
+        return len(self.atlas.glyphs)
+
 
 class ASCIIArt:
-    def __init__(self):
-        # Define patterns using the '1' character - will be replaced with the selected pattern character
-        self.art_patterns = {
-            'A': ["  1  ", " 1 1 ", "11111", "1   1"],
-            'B': ["1111 ", "1   1", "1111 ", "1   1", "1111 "],
-            'C': [" 111 ", "1    ", "1    ", "1    ", " 111 "],
-            'D': ["1111 ", "1   1", "1   1", "1   1", "1111 "],
-            'E': ["11111", "1    ", "111  ", "1    ", "11111"],
-            'F': ["11111", "1    ", "111  ", "1    ", "1    "],
-            'G': [" 111 ", "1    ", "1  11", "1   1", " 111 "],
-            'H': ["1   1", "1   1", "1   1", "1   1"],
-            'I': ["11111", "  1  ", "  1  ", "  1  ", "11111"],
-            'J': ["11111", "   1 ", "   1 ", "1  1 ", " 11  "],
-            'K': ["1  1 ", "1 1  ", "11   ", "1 1  ", "1  1 "],
-            'L': ["1    ", "1    ", "1    ", "1    ", "11111"],
-            'M': ["1   1", "11 11", "1 1 1", "1   1", "1   1"],
-            'N': ["1   1", "11  1", "1 1 1", "1  11", "1   1"],
-            'O': [" 111 ", "1   1", "1   1", "1   1", " 111 "],
-            'P': ["1111 ", "1   1", "1111 ", "1    ", "1    "],
-            'Q': [" 111 ", "1   1", "1   1", "1  11", " 1111"],
-            'R': ["1111 ", "1   1", "1  1 ", "1   1"],
-            'S': [" 111 ", "1    ", " 111 ", "    1", " 111 "],
-            'T': ["11111", "  1  ", "  1  ", "  1  ", "  1  "],
-            'U': ["1   1", "1   1", "1   1", "1   1", " 111 "],
-            'V': ["1   1", "1   1", "1   1", " 1 1 ", "  1  "],
-            'W': ["1   1", "1   1", "1 1 1", "11 11", "1   1"],
-            'X': ["1   1", " 1 1 ", "  1  ", " 1 1 ", "1   1"],
-            'Y': ["1   1", " 1 1 ", "  1  ", "  1  ", "  1  "],
-            'Z': ["11111", "   1 ", "  1  ", " 1   ", "11111"],
-            '0': [" 111 ", "1   1", "1   1", "1   1", " 111 "],
-            '1': ["  1  ", " 11  ", "  1  ", "  1  ", "11111"],
-            '2': [" 111 ", "1   1", "  11 ", " 1   ", "11111"],
-            '3': ["1111 ", "    1", "  11 ", "    1", "1111 "],
-            '4': ["   1 ", "  11 ", " 1 1 ", "11111", "   1 "],
-            '5': ["11111", "1    ", "1111 ", "    1", "1111 "],
-            '6': [" 111 ", "1    ", "1111 ", "1   1", " 111 "],
-            '7': ["11111", "    1", "   1 ", "  1  ", " 1   "],
-            '8': [" 111 ", "1   1", " 111 ", "1   1", " 111 "],
-            '9': [" 111 ", "1   1", " 1111", "    1", " 111 "],
-            ' ': ["     ", "     ", "     ", "     ", "     "],
-            '.': ["     ", "     ", "     ", "     ", "  1  "],
-            ',': ["     ", "     ", "     ", "  1  ", " 1   "],
-            '!': ["  1  ", "  1  ", "  1  ", "     ", "  1  "],
-            '?': [" 111 ", "1   1", "  11 ", "     ", "  1  "],
-            '(': ["  1  ", " 1 1 ", "1   1", " 1 1 ", "  1  "],
-            ')': ["  1  ", " 1 1 ", "1   1", " 1 1 ", "  1  "],
-            # Add more characters as needed
-        }
+    def __init__(self, atlas=None):
+        """
+        Args:
+            atlas (GlyphAtlas, optional): Glyphs to draw with. Defaults to the built-in glyphs;
+                to add or replace glyphs, pass GlyphAtlas(patterns) with the extended patterns.
+        """
+        self.atlas = atlas or DEFAULT_ATLAS
+        # Read-only view of the glyphs this generator draws, built-in or not
+        self.art_patterns = AtlasPatterns(self.atlas)
         
     def get_pattern(self, pattern_char, char):
         """
@@ -65,25 +237,27 @@ class ASCIIArt:
         Returns:
             list: Lines of ASCII art for the character
         """
-        ascii_val = ord(char)
-
-        char = char.upper()  # Use uppercase for consistency
+        with stage('glyph_lookup'):
+            return list(self.atlas.render(pattern_char, char))
         
-        # Get the pattern for the given character or use a default pattern
-        if char in self.art_patterns:
-            pattern = self.art_patterns[char]
-        else:
-            # Default pattern for characters not in the dictionary
-            pattern = [
-                "     ",
-                f"  {char}  ",
-                f" ({ascii_val}) ",
-                "     ",
-                "     "
-            ]
+    def render_rows(self, text, pattern_char='1'):
+        """
+        Render characters side by side into art rows without any length limit.
         
-        # Replace the '1' character with the selected pattern character
-        return [line.replace('1', pattern_char) for line in pattern]
+        Args:
+            text (str): Characters to render on one row of glyphs
+            pattern_char (str, optional): Character to use for patterns. Defaults to '1'.
+            
+        Returns:
+            list: Lines of ASCII art, one per glyph row
+        """
+        render = self.atlas.render
+        with stage('glyph_lookup'):
+            glyphs = [render(pattern_char, char) for char in text]
+        if not glyphs:
+            return [""] * self.atlas.height
+        with stage('row_assembly'):
+            return [" ".join(rows) for rows in zip(*glyphs)]
         
     def generate_art(self, text, pattern_char='1', max_length=15):
         """
@@ -92,7 +266,8 @@ class ASCIIArt:
         Args:
             text (str): Text to convert to ASCII art
             pattern_char (str, optional): Character to use for patterns. Defaults to '1'.
-            max_length (int, optional): Maximum text length to process. Defaults to 15.
+            max_length (int, optional): Maximum text length to process, or None for no limit.
+                Defaults to 15.
             
         Returns:
             tuple: (list of art lines, truncated status)
@@ -100,19 +275,85 @@ class ASCIIArt:
         truncated = False
         
         # Limit text length for better display
-        if len(text) > max_length:
+        if max_length is not None and len(text) > max_length:
             text = text[:max_length]
             truncated = True
             
-        # Generate ASCII art for each character
-        art_lines = [[] for _ in range(5)]  # 5 lines per character
-        
-        for char in text:
-            art = self.get_pattern(pattern_char, char)
-            for i in range(min(len(art), 5)):
-                art_lines[i].append(art[i])
+        return self.render_rows(text, pattern_char), truncated
+
+    def iter_art(self, text, pattern_char='1', width=80):
+        """
+        Stream ASCII art for text of any length, wrapped to a column width.
         
-        # Join the lines together
-        result = [" ".join(line) for line in art_lines]
+        Input is consumed incrementally and art lines are yielded block by block,
+        so memory use is bounded by one block regardless of the input size.
+        Newlines in the input start a new block; blocks are separated by an empty line.
         
-        return result, truncated
\ No newline at end of file
+        Args:
+            text (str or iterable): Text, an iterable of text chunks, or a readable
+                text file object such as sys.stdin
+            pattern_char (str, optional): Character to use for patterns. Defaults to '1'.
+            width (int, optional): Maximum width of an art line in columns. At least one
+                glyph is placed per block. Defaults to 80.
+            
+        Yields:
+            str: Lines of ASCII art
+        """
+        render = self.atlas.render
+        block = []
+        block_width = 0
+        first_block = True
+
+        for char in _iter_chars(text):
+            if char == '\r':
+                continue
+            if char != '\n':
+                glyph_width = len(render(pattern_char, char)[0])
+                if not block or block_width + 1 + glyph_width <= width:
+                    block.append(char)
+                    block_width += glyph_width + (1 if len(block) > 1 else 0)
+                    continue
+            # Flush the current block on a newline or when the next glyph does not fit
+            if block:
+                if not first_block:
+                    yield ""
+                first_block = False
+                yield from self.render_rows(block, pattern_char)
+            block = []
+            block_width = 0
+            if char != '\n':
+                block.append(char)
+                block_width = glyph_width
+
+        if block:
+            if not first_block:
+                yield ""
+            yield from self.render_rows(block, pattern_char)
+
+
+def _iter_chars(source):
+    """Iterate over the characters of a string, chunk iterable or text file object."""
+    if isinstance(source, str):
+        return iter(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        raise TypeError(_binary_input_message(source))
+    chunks = iter(lambda: source.read(STREAM_CHUNK_SIZE), '') if hasattr(source, 'read') else source
+    return chain.from_iterable(map(_text_chunk, chunks))
+
+
+def _text_chunk(chunk):
+    """Check that a chunk read from the input is text; binary reads never reach the '' EOF."""
+    if not isinstance(chunk, str):
+        raise TypeError(_binary_input_message(chunk))
+    return chunk
+
+
+def _binary_input_message(data):
+    return (f"ASCII art input must be text, not {type(data).__name__}; open files in text "
+            f"mode or wrap binary streams in io.TextIOWrapper")
+
+
+if __name__ == "__main__":
+    import sys
+    from batch_render import main
+    sys.exit(main())
@@ -5,18 +5,26 @@ A GUI application for creating and exporting ASCII art.
 """
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from datetime import datetime
-from pathlib import Path
 from ascii_art import ASCIIArt
-from image_export import save_ascii_art_image
+from art_view import ArtDocument, LinesDocument, VirtualArtView
 from constants import COLORS
 
+# Delay after the last keystroke before the preview is re-rendered, in milliseconds
+PREVIEW_DEBOUNCE_MS = 150
+# Width in characters of ASCII art converted from images
+IMAGE_COLUMNS = 100
+
 class ASCIIArtApp:
     def __init__(self, root):
         self.root = root
         self.root.title("ASCII Art Creator")
         self.ascii_generator = ASCIIArt()
         
+        # Pending debounced preview update and the document currently shown in the preview
+        self._update_job = None
+        self._font_size = None
+        self._document = None
+        
         # Configure root window
         self.root.geometry("600x500")
         self.root.minsize(500, 400)
@@ -127,30 +135,11 @@ class ASCIIArtApp:
                                    style="Card.TLabelframe")
         display_frame.grid(row=2, column=0, padx=2, pady=8, sticky="nsew")
         
-        text_container = ttk.Frame(display_frame, style="Main.TFrame")
-        text_container.grid(row=0, column=0, padx=3, pady=3, sticky="nsew")
-        
-        y_scrollbar = ttk.Scrollbar(text_container)
-        y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        x_scrollbar = ttk.Scrollbar(text_container, orient=tk.HORIZONTAL)
-        x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
-        
-        self.art_display = tk.Text(text_container,
-                               height=12,
-                               width=55,
-                               font=('Courier', self.font_size_var.get()),
-                               wrap=tk.NONE,
-                               xscrollcommand=x_scrollbar.set,
-                               yscrollcommand=y_scrollbar.set,
-                               relief="solid",
-                               borderwidth=1,
-                               bg=COLORS['bg'],
-                               fg=COLORS['text'])
-        self.art_display.pack(expand=True, fill=tk.BOTH, padx=2, pady=2)
-        
-        y_scrollbar.config(command=self.art_display.yview)
-        x_scrollbar.config(command=self.art_display.xview)
+        # Virtualized preview: only the visible part of the art is rendered and drawn
+        self.art_display = VirtualArtView(display_frame,
+                                      font_size=self.font_size_var.get(),
+                                      style="Main.TFrame")
+        self.art_display.grid(row=0, column=0, padx=3, pady=3, sticky="nsew")
         
         # Export options frame
         export_frame = ttk.Frame(main_container, style="Main.TFrame")
@@ -176,6 +165,10 @@ class ASCIIArtApp:
                 text="Export as Image",
                 style="Action.TButton",
                 command=self.export_image).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame,
+                text="Load Image",
+                style="Action.TButton",
+                command=self.load_image).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame,
                 text="Clear",
                 style="Danger.TButton",
@@ -191,28 +184,59 @@ class ASCIIArtApp:
         display_frame.rowconfigure(0, weight=1)
             
     def update_art(self, event=None):
-        """Update the ASCII art display when text or pattern changes"""
+        """Schedule a preview update, coalescing rapid keystrokes into one render"""
+        if self._update_job is not None:
+            self.root.after_cancel(self._update_job)
+        self._update_job = self.root.after(PREVIEW_DEBOUNCE_MS, self.refresh_preview)
+        
+    def refresh_preview(self):
+        """Update the ASCII art display for the current text and pattern"""
+        self._update_job = None
         text = self.text_input.get().strip()
-        pattern = self.pattern_input.get().strip()
+        pattern = self.pattern_input.get().strip() or '*'
         
         if not text:
-            self.art_display.delete('1.0', tk.END)
+            self.art_display.clear()
+            self._document = None
+            return
+        
+        document = self._document
+        if isinstance(document, ArtDocument) and document.text == text and \
+                document.pattern_char == pattern:
             return
-            
-        if not pattern:
-            pattern = '*'
         
-        # Generate and display ASCII art
-        ascii_art, truncated = self.ascii_generator.text_to_ascii(text, pattern)
-        self.art_display.delete('1.0', tk.END)
-        self.art_display.insert('1.0', '\n'.join(ascii_art))
+        # Building the document only measures glyphs; the view renders the visible rows
+        self._document = ArtDocument(self.ascii_generator, text, pattern)
+        self.art_display.set_document(self._document)
         
-        if truncated:
-            self.art_display.insert(tk.END, "\n\n(Text truncated due to length)")
+    def load_image(self):
+        """Convert an image file to ASCII art and show it in the preview"""
+        file_path = filedialog.askopenfilename(
+            filetypes=[('Images', '*.png *.jpg *.jpeg *.bmp *.gif *.webp'), ('All Files', '*.*')],
+            title='Open Image'
+        )
+        if not file_path:
+            return
+        
+        try:
+            # Pillow and NumPy are loaded on first use, not at application start
+            from image_to_ascii import DEFAULT_RAMP, image_to_ascii
+            ascii_lines = image_to_ascii(file_path, columns=IMAGE_COLUMNS)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load image: {str(e)}")
+            return
+        
+        # The image replaces any text art until new text is typed
+        if self._update_job is not None:
+            self.root.after_cancel(self._update_job)
+            self._update_job = None
+        self.text_input.delete(0, tk.END)
+        self._document = LinesDocument(ascii_lines, pattern_char=DEFAULT_RAMP[0])
+        self.art_display.set_document(self._document)
             
     def export_image(self):
         """Export the current ASCII art as an image"""
-        if not self.art_display.get('1.0', tk.END).strip():
+        if self._document is None:
             messagebox.showwarning("No Content", "Please create some ASCII art first!")
             return
             
@@ -231,9 +255,10 @@ class ASCIIArtApp:
         
         if file_path:
             try:
-                ascii_lines = self.art_display.get('1.0', tk.END).splitlines()
-                pattern = self.pattern_input.get().strip() or '*'
-                save_ascii_art_image(ascii_lines, pattern, filename=file_path)
+                from image_export import save_ascii_art_image
+                # Render the full art from the document, not just the visible part
+                ascii_lines = list(self._document.iter_lines())
+                save_ascii_art_image(ascii_lines, self._document.pattern_char, filename=file_path)
                 messagebox.showinfo("Success", "ASCII art saved successfully!")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save image: {str(e)}")
@@ -243,14 +268,19 @@ class ASCIIArtApp:
         self.text_input.delete(0, tk.END)
         self.pattern_input.delete(0, tk.END)
         self.pattern_input.insert(0, '*')
-        self.art_display.delete('1.0', tk.END)
+        if self._update_job is not None:
+            self.root.after_cancel(self._update_job)
+            self._update_job = None
+        self.art_display.clear()
+        self._document = None
 
     def update_font_size(self, event=None):
         """Update the font size of the ASCII art display"""
         new_size = self.font_size_var.get()
-        self.art_display.configure(font=('Courier', new_size))
-        # Trigger art update to maintain proper formatting
-        self.update_art()
+        # Only the view font changes; the document stays the same
+        if new_size != self._font_size:
+            self._font_size = new_size
+            self.art_display.set_font_size(new_size)
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Batch Render Module
+This module provides the headless command line interface of the ASCII Art Creator.
+
+Usage:
+    python -m ascii_art render [jobs_file] [--output-dir DIR] [--format png] [--workers N]
+    python -m ascii_art text [--pattern *] [--width 80] < input.txt
+    python -m ascii_art serve [--host 127.0.0.1] [--port 8080] [--workers N]
+    python -m ascii_art image photo.jpg [--columns 100] [--invert] [--export art.png]
+"""
+import argparse
+import json
+import os
+import sys
+from ascii_art import ASCIIArt
+
+EXPORT_FORMATS = ('png', 'jpg', 'pdf', 'svg', 'ans')
+
+# Generator shared by all jobs handled in one worker process
+_generator = None
+
+
+def parse_job(line, defaults):
+    """
+    Parse one job line: either plain text or a JSON object.
+
+    JSON jobs may set "text", "pattern", "format" and "filename";
+    missing fields fall back to the command line defaults. A filename without an
+    export extension gets the job's format appended, a filename with one sets the
+    format when the job does not, and a filename whose extension conflicts with
+    the job's format is an error.
+
+    Args:
+        line (str): Job line without the trailing newline
+        defaults (dict): Default pattern and format
+
+    Returns:
+        dict: Job with text, pattern, format and filename keys
+    """
+    job = dict(defaults, filename=None)
+    spec = {}
+    if line.lstrip().startswith('{'):
+        spec = json.loads(line)
+        if not isinstance(spec.get('text'), str):
+            raise ValueError("JSON job requires a string 'text' field")
+        job.update({key: spec[key] for key in ('text', 'pattern', 'format', 'filename') if key in spec})
+    else:
+        job['text'] = line
+
+    job['format'] = _normalize_format(job['format'])
+    if job['format'] not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported format: {job['format']}")
+
+    if job['filename']:
+        # Keep job-supplied names inside the output directory
+        filename = os.path.basename(job['filename'])
+        extension = _normalize_format(os.path.splitext(filename)[1][1:])
+        if extension not in EXPORT_FORMATS:
+            filename = f"{filename}.{job['format']}"
+        elif 'format' not in spec:
+            job['format'] = extension
+        elif extension != job['format']:
+            raise ValueError(f"Filename {filename!r} does not match format {job['format']!r}")
+        job['filename'] = filename
+    return job
+
+
+def _normalize_format(fmt):
+    """Lowercase a format name or extension and map 'jpeg' to 'jpg'."""
+    fmt = str(fmt).lower()
+    return 'jpg' if fmt == 'jpeg' else fmt
+
+
+def create_generator(glyph_font=None):
+    """Create an ASCIIArt generator, optionally using an external glyph font."""
+    if not glyph_font:
+        return ASCIIArt()
+    from glyph_fonts import load_font
+    return ASCIIArt(load_font(glyph_font))
+
+
+def init_worker(font_name, glyph_font=None):
+    """Load fonts once per worker process instead of on the first job."""
+    global _generator
+    from image_export import warm_fonts
+    warm_fonts(font_name=font_name)
+    _generator = create_generator(glyph_font)
+
+
+def render_job(task):
+    """
+    Render and export one job. Runs inside a worker process.
+
+    Args:
+        task (tuple): (job index, raw job line, defaults dict, output directory, raster flag, font,
+            vector PDF flag)
+
+    Returns:
+        dict: Result record with "job", "ok" and either "path" or "error"
+    """
+    global _generator
+    index, line, defaults, output_dir, raster, font_name, vector = task
+
+    try:
+        job = parse_job(line, defaults)
+        if _generator is None:
+            _generator = ASCIIArt()
+        art_lines, _ = _generator.generate_art(job['text'], job['pattern'], max_length=None)
+
+        from image_export import save_ascii_art_image
+        filename = job['filename'] or f"ascii_art_{index:06d}.{job['format']}"
+        path = save_ascii_art_image(art_lines, job['pattern'], filename=filename,
+                                    download_folder=output_dir, raster=raster, font_name=font_name,
+                                    vector=vector)
+        return {'job': index, 'ok': True, 'path': path}
+    except Exception as e:
+        return {'job': index, 'ok': False, 'error': f"{type(e).__name__}: {e}"}
+
+
+def run_render(args):
+    """Render every job line across a process pool, reporting results in input order."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    defaults = {'pattern': args.pattern, 'format': args.format}
+    source = sys.stdin if args.jobs == '-' else open(args.jobs, encoding='utf-8')
+
+    failures = 0
+    with source:
+        tasks = ((index, line.rstrip('\n'), defaults, args.output_dir, args.raster, args.font,
+                  args.vector)
+                 for index, line in enumerate(source) if line.strip())
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker,
+                                 initargs=(args.font, args.glyphs)) as executor:
+            # map() yields results in submission order while jobs run in chunks
+            for result in executor.map(render_job, tasks, chunksize=args.chunksize):
+                failures += not result['ok']
+                print(json.dumps(result), flush=True)
+
+    return 1 if failures else 0
+
+
+def run_text(args):
+    """Stream ASCII art for standard input or a file to standard output."""
+    source = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8')
+    with source:
+        for line in create_generator(args.glyphs).iter_art(source, args.pattern, width=args.width):
+            sys.stdout.write(line + '\n')
+    return 0
+
+
+def run_image(args):
+    """Print ASCII art converted from an image, or export it with --export."""
+    import io
+    from image_to_ascii import DEFAULT_RAMP, iter_image_ascii
+
+    # Images need a seekable stream, so standard input is read into memory
+    source = io.BytesIO(sys.stdin.buffer.read()) if args.input == '-' else args.input
+    ramp = args.ramp or DEFAULT_RAMP
+    lines = iter_image_ascii(source, args.columns, ramp=ramp, invert=args.invert)
+
+    if args.export:
+        from image_export import save_ascii_art_image
+        folder, filename = os.path.split(os.path.abspath(args.export))
+        save_ascii_art_image(list(lines), ramp[0], filename=filename, download_folder=folder,
+                             raster=args.raster)
+        return 0
+
+    for line in lines:
+        sys.stdout.write(line + '\n')
+    return 0
+
+
+def run_serve(args):
+    """Run the asyncio HTTP render service."""
+    from render_service import run_service
+    return run_service(args)
+
+
+def build_parser():
+    """Create the argument parser for the command line interface."""
+    parser = argparse.ArgumentParser(prog='python -m ascii_art',
+                                     description="Headless ASCII art rendering and export.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    render = commands.add_parser('render', help="render and export many jobs in parallel")
+    render.add_argument('jobs', nargs='?', default='-',
+                        help="file with one text or JSON job per line ('-' for stdin)")
+    render.add_argument('-o', '--output-dir', default='.', help="directory for exported files")
+    render.add_argument('-p', '--pattern', default='*', help="default pattern character")
+    render.add_argument('-f', '--format', default='png', choices=EXPORT_FORMATS,
+                        help="default export format")
+    render.add_argument('-w', '--workers', type=int, default=os.cpu_count(),
+                        help="number of worker processes")
+    render.add_argument('--chunksize', type=int, default=16, help="jobs sent to a worker at once")
+    render.add_argument('--raster', action='store_true', help="use the fast cell raster mode")
+    render.add_argument('--vector', action='store_true', help="write PDF as text instead of a bitmap")
+    render.add_argument('--font', help="font name or font file path (defaults to Courier)")
+    render.add_argument('--glyphs', help="FIGlet (.flf) or JSON glyph font for the art")
+    render.set_defaults(handler=run_render)
+
+    text = commands.add_parser('text', help="print ASCII art for text to stdout")
+    text.add_argument('input', nargs='?', default='-', help="input file ('-' for stdin)")
+    text.add_argument('-p', '--pattern', default='*', help="pattern character")
+    text.add_argument('--width', type=int, default=80, help="maximum output width in columns")
+    text.add_argument('--glyphs', help="FIGlet (.flf) or JSON glyph font for the art")
+    text.set_defaults(handler=run_text)
+
+    image = commands.add_parser('image', help="convert an image to ASCII art")
+    image.add_argument('input', nargs='?', default='-', help="image file ('-' for stdin)")
+    image.add_argument('-c', '--columns', type=int, default=80, help="art width in characters")
+    image.add_argument('--ramp', help="characters from darkest to lightest")
+    image.add_argument('--invert', action='store_true',
+                       help="map dark pixels to light characters (for dark terminals)")
+    image.add_argument('--export', help="save the art to this file (png, jpg, pdf, svg or ans)")
+    image.add_argument('--raster', action='store_true', help="use the fast cell raster mode")
+    image.set_defaults(handler=run_image)
+
+    serve = commands.add_parser('serve', help="run the local HTTP render service")
+    serve.add_argument('--host', default='127.0.0.1', help="interface to listen on")
+    serve.add_argument('--port', type=int, default=8080, help="port to listen on")
+    serve.add_argument('-w', '--workers', type=int, default=os.cpu_count(),
+                       help="number of worker processes")
+    serve.add_argument('--max-pending', type=int, default=64,
+                       help="renders in flight before requests are rejected with 503")
+    serve.set_defaults(handler=run_serve)
+
+    return parser
+
+
+def main(argv=None):
+    """Entry point of the command line interface."""
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Performance benchmarks for the ASCII art hot paths: glyph lookup, art generation,
+rasterization and encoding, using pytest-benchmark.
+
+Usage:
+    python -m pytest benchmarks                                   # run and print timings
+    python -m pytest benchmarks --benchmark-autosave              # store a baseline in .benchmarks/
+    python -m pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:20%
+"""
+import pytest
+from ascii_art import ASCIIArt
+from compact_art import CompactArt
+
+SAMPLE_TEXT = "The quick brown fox jumps over the lazy dog! 0123456789? "
+
+GENERATE_LENGTHS = (1, 10, 100, 1000, 10000, 100000)
+IMAGE_LINE_COUNTS = (5, 50, 200)
+IMAGE_FONT_SIZES = (8, 12, 20)
+SAVE_FORMATS = ('png', 'jpg', 'pdf')
+
+
+def _sample(length):
+    """Return sample text of exactly the given length."""
+    return (SAMPLE_TEXT * (length // len(SAMPLE_TEXT) + 1))[:length]
+
+
+def _art_lines(line_count, columns=40):
+    """Return ASCII art lines for image benchmarks, stacking blocks of generated art."""
+    block, _ = ASCIIArt().generate_art(_sample(columns // 6), '*')
+    return (block * (line_count // len(block) + 1))[:line_count]
+
+
+@pytest.fixture(scope='module')
+def generator():
+    return ASCIIArt()
+
+
+def test_get_pattern(benchmark, generator):
+    benchmark(generator.get_pattern, '*', 'A')
+
+
+@pytest.mark.parametrize('length', GENERATE_LENGTHS)
+def test_generate_art(benchmark, generator, length):
+    benchmark(generator.generate_art, _sample(length), '*', max_length=None)
+
+
+@pytest.mark.parametrize('font_size', IMAGE_FONT_SIZES)
+@pytest.mark.parametrize('line_count', IMAGE_LINE_COUNTS)
+def test_ascii_to_image(benchmark, line_count, font_size):
+    from image_export import ascii_to_image
+    benchmark(ascii_to_image, _art_lines(line_count), '*', font_size=font_size)
+
+
+@pytest.mark.parametrize('line_count', IMAGE_LINE_COUNTS)
+def test_ascii_to_image_raster(benchmark, line_count):
+    from image_export import ascii_to_image
+    benchmark(ascii_to_image, _art_lines(line_count), '*', raster=True)
+
+
+@pytest.mark.parametrize('line_count', IMAGE_LINE_COUNTS)
+def test_ascii_to_image_compact(benchmark, line_count):
+    from image_export import ascii_to_image
+    compact = CompactArt.from_lines(_art_lines(line_count), '*')
+    benchmark(ascii_to_image, compact, '*', raster=True)
+
+
+@pytest.mark.parametrize('fmt', SAVE_FORMATS)
+def test_save_ascii_art_image(benchmark, tmp_path, fmt):
+    from image_export import save_ascii_art_image
+    lines = _art_lines(50)
+    benchmark(save_ascii_art_image, lines, '*', filename=f'bench.{fmt}',
+              download_folder=str(tmp_path))
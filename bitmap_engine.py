@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Bitmap Engine Module
+This module provides a NumPy-vectorized rendering backend for ASCII art.
+"""
+import numpy as np
+from ascii_art import DEFAULT_ATLAS
+
+
+class BitmapEngine:
+    """
+    Render text as a boolean glyph mask using NumPy.
+
+    Every glyph of a GlyphAtlas is stored as a boolean array with a trailing
+    blank separator column. A string is rendered by gathering the glyph arrays
+    for its code points in one fancy-index operation and laying them out along
+    the column axis, with no per-character Python loop.
+    """
+
+    def __init__(self, atlas=None):
+        """
+        Build the glyph array table from an atlas.
+
+        Glyphs narrower than the widest glyph are padded on the right, so every
+        character occupies the same cell width. Characters missing from the atlas
+        render as a hollow box, since the text placeholder has no bitmap form.
+
+        Args:
+            atlas (GlyphAtlas, optional): Glyph atlas to use. Defaults to the built-in atlas.
+        """
+        self.atlas = atlas or DEFAULT_ATLAS
+        self.height = self.atlas.height
+        self.width = max(width for width, _ in self.atlas.glyphs.values())
+
+        chars = list(self.atlas.glyphs)
+        # One extra cell: the separator column between glyphs
+        glyphs = np.zeros((len(chars) + 1, self.height, self.width + 1), dtype=bool)
+        columns = np.arange(self.width)
+        for index, char in enumerate(chars):
+            _, masks = self.atlas.glyphs[char]
+            glyphs[index, :, :self.width] = (np.array(masks)[:, None] >> columns) & 1
+
+        # Hollow box for characters the atlas does not define
+        self.unknown_index = len(chars)
+        glyphs[self.unknown_index, [0, -1], :self.width] = True
+        glyphs[self.unknown_index, :, [0, self.width - 1]] = True
+        self.glyphs = glyphs
+
+        # Code point -> glyph index table covering Latin-1 and every atlas character,
+        # resolved like ASCIIArt does (lowercase and accented letters share glyphs)
+        indices = {char: index for index, char in enumerate(chars)}
+        size = max(256, max(ord(char) for char in chars if len(char) == 1) + 1)
+        self.lookup_table = np.full(size, self.unknown_index, dtype=np.intp)
+        for code_point in range(size):
+            key = self.atlas.resolve(chr(code_point))
+            if key is not None:
+                self.lookup_table[code_point] = indices[key]
+
+    def glyph_indices(self, text):
+        """
+        Map every character of a string to its glyph index.
+
+        Args:
+            text (str): Text to map
+
+        Returns:
+            numpy.ndarray: Glyph indices, one per character
+        """
+        code_points = np.frombuffer(text.encode('utf-32-le'), dtype='<u4')
+        in_table = code_points < len(self.lookup_table)
+        clipped = np.where(in_table, code_points, 0)
+        return np.where(in_table, self.lookup_table[clipped], self.unknown_index)
+
+    def render_mask(self, text):
+        """
+        Render text into a 2-D boolean mask.
+
+        Args:
+            text (str): Text to render
+
+        Returns:
+            numpy.ndarray: Mask of shape (height, columns); True marks drawn cells
+        """
+        if not text:
+            return np.zeros((self.height, 0), dtype=bool)
+
+        cells = self.glyphs[self.glyph_indices(text)]
+        count = cells.shape[0]
+        mask = cells.transpose(1, 0, 2).reshape(self.height, count * (self.width + 1))
+        # Drop the separator after the last glyph
+        return mask[:, :-1]
+
+    @staticmethod
+    def mask_to_lines(mask, pattern_char='1'):
+        """
+        Convert a glyph mask into lines of ASCII art.
+
+        Args:
+            mask (numpy.ndarray): 2-D boolean mask
+            pattern_char (str, optional): Single character drawn for set cells. Defaults to '1'.
+
+        Returns:
+            list: Lines of ASCII art
+        """
+        if len(pattern_char) != 1:
+            raise ValueError("Bitmap rendering requires a single pattern character")
+
+        code_points = np.where(mask, ord(pattern_char), ord(' ')).astype('<u4')
+        return [row.tobytes().decode('utf-32-le') for row in code_points]
+
+    def render_lines(self, text, pattern_char='1'):
+        """
+        Render text into lines of ASCII art.
+
+        Args:
+            text (str): Text to render
+            pattern_char (str, optional): Single character used for patterns. Defaults to '1'.
+
+        Returns:
+            list: Lines of ASCII art
+        """
+        return self.mask_to_lines(self.render_mask(text), pattern_char)
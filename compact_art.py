@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Compact Art Module
+This module provides a packed bit matrix representation of rendered ASCII art.
+
+Rendered art is made of the pattern character and spaces. CompactArt stores one
+bit per cell, set where the pattern is drawn, with the pattern character stored
+once, so a cell takes one bit instead of the byte or more of a string character.
+The few other non-space segments (placeholders for characters without a glyph)
+are kept as a literal overlay.
+
+CompactArt iterates over its lines like a list of art lines, so it can be passed
+to any function that accepts ASCII art lines, and exporters can read its runs of
+drawn cells to skip the blank cells entirely.
+"""
+import re
+import struct
+import sys
+from array import array
+from functools import lru_cache
+from itertools import accumulate
+from ascii_art import ASCIIArt
+
+COMPACT_MAGIC = b'AACA'
+COMPACT_VERSION = 2
+# magic, version, height, bit matrix byte length, literal count, pattern byte length
+COMPACT_HEADER = struct.Struct('<4sHIIII')
+# row, start column, literal byte length
+COMPACT_LITERAL = struct.Struct('<III')
+
+_SEGMENT = re.compile(r'[^ ]+')
+_SET_BITS = re.compile(r'1+')
+# Bits of every byte value as a '0'/'1' string, least significant bit first
+_BYTE_BITS = tuple(format(value, '08b')[::-1] for value in range(256))
+
+
+def _row_cells(row, pattern_char):
+    """
+    Split one line of art into pattern cells and literal segments.
+
+    Returns:
+        tuple: ('0'/'1' string with one character per column, '1' where the pattern
+            is drawn, tuple of (start, text) literal segments)
+    """
+    bits = []
+    literals = []
+    column = 0
+    for match in _SEGMENT.finditer(row):
+        start, segment = match.start(), match.group()
+        if segment == pattern_char * (len(segment) // len(pattern_char)):
+            bits.append('0' * (start - column))
+            bits.append('1' * len(segment))
+            column = match.end()
+        else:
+            literals.append((start, segment))
+    bits.append('0' * (len(row) - column))
+    return ''.join(bits), tuple(literals)
+
+
+@lru_cache(maxsize=4096)
+def _glyph_row_cells(row, pattern_char):
+    """_row_cells for one glyph row; glyph rows are short and repeat, unlike full art lines."""
+    return _row_cells(row, pattern_char)
+
+
+def _pack_bits(bits):
+    """Pack a '0'/'1' string into bytes, first column in the lowest bit of the first byte."""
+    if not bits:
+        return b''
+    return int(bits[::-1], 2).to_bytes((len(bits) + 7) // 8, 'little')
+
+
+class _Builder:
+    """Accumulates the bit matrix and literals of a CompactArt row by row."""
+
+    def __init__(self):
+        self.line_lengths = array('I')
+        self.bits = bytearray()
+        self.literals = {}
+
+    def add_row(self, bits, literals=()):
+        """Add a row from its '0'/'1' cell string and (start, text) literal segments."""
+        if literals:
+            self.literals[len(self.line_lengths)] = tuple(literals)
+        self.line_lengths.append(len(bits))
+        self.bits += _pack_bits(bits)
+
+    def build(self, pattern_char):
+        return CompactArt(pattern_char, self.line_lengths, bytes(self.bits), self.literals)
+
+
+def _little_endian(values):
+    """Return a copy of an array in little-endian byte order."""
+    values = array(values.typecode, values)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+class CompactArt:
+    """
+    ASCII art as a packed bit matrix.
+
+    Row r takes (line_lengths[r] + 7) // 8 bytes of bits, starting at
+    row_offsets[r]; bit N of a row (least significant bit first) is set where
+    column N draws the pattern character. Literal segments are kept in a dict of
+    row -> tuple of (start column, text).
+    """
+
+    def __init__(self, pattern_char, line_lengths, bits, literals=None):
+        """
+        Args:
+            pattern_char (str): Character used for the ASCII art
+            line_lengths (array): Length of every line, including trailing spaces
+            bits (bytes): Packed cells of all rows, one byte-aligned row after the other
+            literals (dict, optional): Row -> tuple of (start column, text) of the
+                segments that are not pattern runs
+        """
+        self.pattern_char = pattern_char
+        self.line_lengths = line_lengths
+        self.bits = bits
+        self.literals = literals or {}
+        self.row_offsets = array('I', accumulate(((length + 7) // 8 for length in line_lengths),
+                                                 initial=0))
+
+    @classmethod
+    def from_lines(cls, ascii_lines, pattern_char):
+        """
+        Encode lines of ASCII art, consuming them one at a time.
+
+        Args:
+            ascii_lines (iterable): Lines of ASCII art, e.g. a list or ASCIIArt.iter_art()
+            pattern_char (str): Character used for the ASCII art
+
+        Returns:
+            CompactArt: Encoded art
+        """
+        if not pattern_char:
+            raise ValueError("Pattern character must not be empty")
+
+        builder = _Builder()
+        for line in ascii_lines:
+            builder.add_row(*_row_cells(line, pattern_char))
+        return builder.build(pattern_char)
+
+    @classmethod
+    def from_text(cls, text, pattern_char='1', generator=None):
+        """
+        Render text as one row of glyphs straight into the compact form.
+
+        Glyph rows are encoded once per (row, pattern) and joined with a blank
+        separator column, so the full-width art lines are never built.
+
+        Args:
+            text (str): Text to render
+            pattern_char (str, optional): Character to use for patterns. Defaults to '1'.
+            generator (ASCIIArt, optional): Generator providing the glyphs. Defaults to
+                a generator using the built-in glyphs.
+
+        Returns:
+            CompactArt: Encoded art, equal to from_lines(generator.render_rows(text))
+        """
+        if not pattern_char:
+            raise ValueError("Pattern character must not be empty")
+
+        atlas = (generator or ASCIIArt()).atlas
+        glyphs = [atlas.render(pattern_char, char) for char in text]
+
+        builder = _Builder()
+        for glyph_row in range(atlas.height):
+            pieces = []
+            literals = []
+            column = 0
+            for glyph in glyphs:
+                row = glyph[glyph_row]
+                bits, row_literals = _glyph_row_cells(row, pattern_char)
+                pieces.append(bits)
+                literals.extend((column + start, literal) for start, literal in row_literals)
+                column += len(row) + 1
+            builder.add_row('0'.join(pieces), literals)
+        return builder.build(pattern_char)
+
+    @property
+    def height(self):
+        """Number of lines."""
+        return len(self.line_lengths)
+
+    @property
+    def width(self):
+        """Length of the longest line."""
+        return max(self.line_lengths, default=0)
+
+    def __len__(self):
+        return self.height
+
+    def __eq__(self, other):
+        if not isinstance(other, CompactArt):
+            return NotImplemented
+        return (self.pattern_char == other.pattern_char and
+                self.line_lengths == other.line_lengths and
+                self.bits == other.bits and
+                self.literals == other.literals)
+
+    def rows(self, start, stop):
+        """
+        Take a band of lines.
+
+        Args:
+            start (int): First line
+            stop (int): Line after the last one
+
+        Returns:
+            CompactArt: Lines [start, stop) as separate art
+        """
+        start, stop, _ = slice(start, stop).indices(self.height)
+        stop = max(start, stop)
+        return CompactArt(self.pattern_char,
+                          self.line_lengths[start:stop],
+                          self.bits[self.row_offsets[start]:self.row_offsets[stop]],
+                          {row - start: literals for row, literals in self.literals.items()
+                           if start <= row < stop})
+
+    def _row_bits(self, row):
+        """Return the cells of a line as a '0'/'1' string."""
+        packed = self.bits[self.row_offsets[row]:self.row_offsets[row + 1]]
+        return ''.join(map(_BYTE_BITS.__getitem__, packed))[:self.line_lengths[row]]
+
+    def iter_runs(self, row):
+        """
+        Iterate over the drawn segments of a line, from left to right.
+
+        Args:
+            row (int): Line number
+
+        Yields:
+            tuple: (start column, length, text) where text is the literal segment, or
+                None for a run of the pattern character
+        """
+        runs = [(match.start(), match.end() - match.start(), None)
+                for match in _SET_BITS.finditer(self._row_bits(row))]
+        literals = self.literals.get(row)
+        if literals:
+            runs.extend((start, len(text), text) for start, text in literals)
+            runs.sort()
+        return iter(runs)
+
+    def row_contains(self, row, chars):
+        """Return True if any of chars is drawn in a line."""
+        if any(c in chars for c in self.pattern_char) and \
+                any(self.bits[self.row_offsets[row]:self.row_offsets[row + 1]]):
+            return True
+        return any(c in chars for _, text in self.literals.get(row, ()) for c in text)
+
+    def line(self, row):
+        """Decode one line of ASCII art."""
+        parts = []
+        column = 0
+        for start, length, literal in self.iter_runs(row):
+            parts.append(' ' * (start - column))
+            parts.append(literal if literal is not None
+                         else self.pattern_char * (length // len(self.pattern_char)))
+            column = start + length
+        parts.append(' ' * (self.line_lengths[row] - column))
+        return ''.join(parts)
+
+    def __iter__(self):
+        for row in range(self.height):
+            yield self.line(row)
+
+    def to_lines(self):
+        """Decode all lines of ASCII art."""
+        return list(self)
+
+    def to_bytes(self):
+        """
+        Serialize the art.
+
+        Layout: header, pattern character (UTF-8), line lengths as a little-endian
+        uint32 array, the packed bit matrix, then (row, start column, byte length,
+        UTF-8 text) per literal.
+
+        Returns:
+            bytes: Serialized art
+        """
+        pattern = self.pattern_char.encode('utf-8')
+        literals = [(row, start, text) for row, segments in sorted(self.literals.items())
+                    for start, text in segments]
+        parts = [COMPACT_HEADER.pack(COMPACT_MAGIC, COMPACT_VERSION, self.height, len(self.bits),
+                                     len(literals), len(pattern)),
+                 pattern,
+                 _little_endian(self.line_lengths).tobytes(),
+                 bytes(self.bits)]
+        for row, start, text in literals:
+            data = text.encode('utf-8', errors='surrogatepass')
+            parts.append(COMPACT_LITERAL.pack(row, start, len(data)))
+            parts.append(data)
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Deserialize art written by to_bytes.
+
+        Args:
+            data (bytes): Serialized art
+
+        Returns:
+            CompactArt: Decoded art
+        """
+        data = memoryview(data)
+        try:
+            magic, version, height, bit_length, literal_count, pattern_length = \
+                COMPACT_HEADER.unpack_from(data)
+        except struct.error:
+            raise ValueError("Truncated compact art data")
+        if magic != COMPACT_MAGIC or version != COMPACT_VERSION:
+            raise ValueError(f"Not compact art data of version {COMPACT_VERSION}")
+
+        position = COMPACT_HEADER.size
+        pattern_char = bytes(data[position:position + pattern_length]).decode('utf-8')
+        position += pattern_length
+
+        line_lengths = array('I')
+        chunk = data[position:position + height * line_lengths.itemsize]
+        if len(chunk) != height * line_lengths.itemsize:
+            raise ValueError("Truncated compact art data")
+        line_lengths.frombytes(chunk)
+        if sys.byteorder == 'big':
+            line_lengths.byteswap()
+        position += len(chunk)
+
+        bits = bytes(data[position:position + bit_length])
+        if len(bits) != bit_length or bit_length != sum((length + 7) // 8 for length in line_lengths):
+            raise ValueError("Truncated compact art data")
+        position += bit_length
+
+        literals = {}
+        for _ in range(literal_count):
+            try:
+                row, start, length = COMPACT_LITERAL.unpack_from(data, position)
+            except struct.error:
+                raise ValueError("Truncated compact art data")
+            position += COMPACT_LITERAL.size
+            text = bytes(data[position:position + length]).decode('utf-8', errors='surrogatepass')
+            literals[row] = literals.get(row, ()) + ((start, text),)
+            position += length
+
+        return cls(pattern_char, line_lengths, bits, literals)
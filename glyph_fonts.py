@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Glyph Fonts Module
+This module loads external glyph fonts for ASCIIArt: FIGlet (.flf) fonts and a simple
+JSON format, of any glyph height. Fonts are validated, normalized to ink masks and
+compiled into a binary cache that later processes memory-map instead of re-parsing.
+
+JSON fonts look like:
+    {"height": 5, "glyphs": {"A": ["  1  ", " 1 1 ", "11111", "1   1", "1   1"], ...}}
+
+Every non-space cell of a glyph is ink, drawn with the selected pattern character.
+FIGlet glyphs are laid out at full width; FIGlet smushing rules are not applied.
+
+Usage:
+    generator = ASCIIArt(load_font('fonts/standard.flf'))
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Mapping
+from ascii_art import GlyphAtlas
+
+CACHE_MAGIC = b'AAGF'
+CACHE_VERSION = 1
+# magic, version, glyph height, glyph count
+CACHE_HEADER = struct.Struct('<4sHHI')
+# code point, glyph width, offset of the row data
+CACHE_INDEX_ENTRY = struct.Struct('<IHI')
+
+# Characters defined, in order, by every FIGlet font before any code-tagged glyphs
+FIGLET_REQUIRED_CODES = list(range(32, 127)) + [196, 214, 220, 228, 246, 252, 223]
+
+
+class FontError(ValueError):
+    """Raised when a font file is malformed."""
+
+
+def _default_cache_dir():
+    return os.environ.get('ASCII_ART_FONT_CACHE',
+                          os.path.join(os.path.expanduser('~'), '.cache', 'ascii_art', 'fonts'))
+
+
+def _ink_rows(rows, blank=' '):
+    """Normalize glyph rows to '1' for ink and ' ' for blank cells."""
+    return [''.join(' ' if cell in (' ', blank) else '1' for cell in row) for row in rows]
+
+
+def _parse_code_tag(tag):
+    """Parse a FIGlet code tag: decimal, 0x-prefixed hex or 0-prefixed octal, maybe negative."""
+    sign = -1 if tag.startswith('-') else 1
+    digits = tag.lstrip('-')
+    if digits.lower().startswith('0x'):
+        return sign * int(digits, 16)
+    if len(digits) > 1 and digits.startswith('0'):
+        return sign * int(digits, 8)
+    return sign * int(digits)
+
+
+def parse_flf(text):
+    """
+    Parse a FIGlet font.
+
+    Args:
+        text (str): Contents of an .flf file
+
+    Returns:
+        tuple: (glyph height, dict of character -> rows using '1' for ink)
+    """
+    lines = text.splitlines()
+    header = lines[0].split() if lines else []
+    if len(header) < 6 or not header[0].startswith('flf2a') or len(header[0]) < 6:
+        raise FontError("Not a FIGlet font: missing 'flf2a' header")
+    hardblank = header[0][5]
+    try:
+        height, comment_lines = int(header[1]), int(header[5])
+    except ValueError:
+        raise FontError("Invalid FIGlet header values")
+    if height < 1:
+        raise FontError("FIGlet font height must be positive")
+
+    position = 1 + comment_lines
+
+    def read_glyph():
+        nonlocal position
+        rows = lines[position:position + height]
+        if len(rows) < height:
+            raise FontError(f"Truncated glyph at line {position + 1}")
+        position += height
+        # Each row ends with one or more end mark characters (usually '@')
+        return _ink_rows([row.rstrip(row[-1]) if row else row for row in rows], hardblank)
+
+    patterns = {}
+    for code in FIGLET_REQUIRED_CODES:
+        if position >= len(lines):
+            # Some fonts omit the German characters
+            break
+        patterns[chr(code)] = read_glyph()
+
+    # Code-tagged glyphs: a line with the code point, then the glyph rows
+    while position < len(lines):
+        tag = lines[position].split(maxsplit=1)
+        position += 1
+        if not tag:
+            continue
+        try:
+            code = _parse_code_tag(tag[0])
+        except ValueError:
+            raise FontError(f"Invalid code tag {tag[0]!r} at line {position}")
+        rows = read_glyph()
+        # Negative codes are reserved for FIGlet translation tables
+        if 0 <= code <= 0x10FFFF:
+            patterns[chr(code)] = rows
+
+    return height, patterns
+
+
+def parse_json_font(text):
+    """
+    Parse a JSON glyph font.
+
+    Args:
+        text (str): Contents of a JSON font file
+
+    Returns:
+        tuple: (glyph height, dict of character -> rows using '1' for ink)
+    """
+    try:
+        font = json.loads(text)
+    except ValueError as e:
+        raise FontError(f"Invalid JSON font: {e}")
+    glyphs = font.get('glyphs') if isinstance(font, dict) else None
+    if not isinstance(glyphs, dict) or not glyphs:
+        raise FontError("JSON font requires a non-empty 'glyphs' object")
+
+    patterns = {}
+    for char, rows in glyphs.items():
+        if len(char) != 1:
+            raise FontError(f"Glyph key {char!r} must be a single character")
+        if not isinstance(rows, list) or not all(isinstance(row, str) for row in rows):
+            raise FontError(f"Glyph {char!r} must be a list of strings")
+        patterns[char] = _ink_rows(rows)
+
+    height = font.get('height') or max(len(rows) for rows in patterns.values())
+    if not isinstance(height, int) or height < 1:
+        raise FontError("'height' must be a positive integer")
+    return height, patterns
+
+
+def write_font_cache(path, atlas):
+    """
+    Write a compiled atlas to a binary font cache file.
+
+    Layout: header, index of (code point, width, data offset) sorted by code point,
+    then for each glyph its rows as little-endian bitmasks of (width + 7) // 8 bytes.
+
+    Args:
+        path (str): Cache file path
+        atlas (GlyphAtlas): Compiled atlas
+    """
+    glyphs = sorted(((ord(char), width, masks) for char, (width, masks) in atlas.glyphs.items()
+                     if len(char) == 1))
+    index = bytearray()
+    data = bytearray()
+    for code, width, masks in glyphs:
+        index += CACHE_INDEX_ENTRY.pack(code, width, len(data))
+        row_bytes = (width + 7) // 8
+        for mask in masks:
+            data += mask.to_bytes(row_bytes, 'little')
+
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, atlas.height, len(glyphs)))
+            f.write(index)
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class MappedGlyphs(Mapping):
+    """
+    Read-only glyph mapping backed by a memory-mapped font cache.
+
+    Only the index is read when the cache is opened; glyph rows are decoded from
+    the mapping on first access and kept afterwards.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, self.height, count = CACHE_HEADER.unpack_from(self._data)
+        except struct.error:
+            raise FontError(f"Truncated font cache: {path}")
+        if magic != CACHE_MAGIC or version != CACHE_VERSION:
+            raise FontError(f"Not a font cache of version {CACHE_VERSION}: {path}")
+
+        data_start = CACHE_HEADER.size + count * CACHE_INDEX_ENTRY.size
+        self._index = {chr(code): (width, data_start + offset) for code, width, offset in
+                       CACHE_INDEX_ENTRY.iter_unpack(self._data[CACHE_HEADER.size:data_start])}
+        self._decoded = {}
+
+    def __getitem__(self, char):
+        glyph = self._decoded.get(char)
+        if glyph is None:
+            width, offset = self._index[char]
+            row_bytes = (width + 7) // 8
+            if row_bytes:
+                masks = tuple(int.from_bytes(self._data[start:start + row_bytes], 'little')
+                              for start in range(offset, offset + row_bytes * self.height, row_bytes))
+            else:
+                # Empty FIGcharacters (e.g. the Deutsch characters of many fonts) store no rows
+                masks = (0,) * self.height
+            glyph = self._decoded[char] = (width, masks)
+        return glyph
+
+    def __contains__(self, char):
+        return char in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+
+def compile_font(path):
+    """
+    Parse and compile a font file without using the cache.
+
+    Args:
+        path (str): Path to an .flf or .json font
+
+    Returns:
+        GlyphAtlas: Compiled atlas
+    """
+    with open(path, encoding='latin-1' if path.lower().endswith('.flf') else 'utf-8') as f:
+        text = f.read()
+    if path.lower().endswith('.json'):
+        height, patterns = parse_json_font(text)
+    else:
+        height, patterns = parse_flf(text)
+    if not patterns:
+        raise FontError(f"Font defines no glyphs: {path}")
+    return GlyphAtlas(patterns, height)
+
+
+def cache_path_for(path, cache_dir=None):
+    """Return the cache file path for a font, keyed by its location, size and modification time."""
+    stat = os.stat(path)
+    source = f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+    digest = hashlib.sha1(source.encode('utf-8')).hexdigest()[:16]
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(cache_dir or _default_cache_dir(), f"{name}-{digest}.glyphs")
+
+
+def load_font(path, cache_dir=None, use_cache=True):
+    """
+    Load a glyph font for ASCIIArt, compiling it into the binary cache on first use.
+
+    Args:
+        path (str): Path to an .flf, .json or compiled .glyphs font file
+        cache_dir (str, optional): Cache directory. Defaults to ASCII_ART_FONT_CACHE or
+            ~/.cache/ascii_art/fonts.
+        use_cache (bool, optional): Read and write the binary cache. Defaults to True.
+
+    Returns:
+        GlyphAtlas: Atlas to pass to ASCIIArt
+    """
+    if path.lower().endswith('.glyphs'):
+        glyphs = MappedGlyphs(path)
+        return GlyphAtlas.from_compiled(glyphs, glyphs.height)
+    if not use_cache:
+        return compile_font(path)
+
+    cache_path = cache_path_for(path, cache_dir)
+    if not os.path.exists(cache_path):
+        write_font_cache(cache_path, compile_font(path))
+    glyphs = MappedGlyphs(cache_path)
+    return GlyphAtlas.from_compiled(glyphs, glyphs.height)
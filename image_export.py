@@ -2,44 +2,300 @@
 """
 Image Export Module
 This module provides functionality to export ASCII art as image files.
+
+Pillow is imported by the functions that draw, on first use, so importing this
+module (e.g. for SVG or ANSI export) stays cheap.
 """
+import io
 import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice, repeat
 from pathlib import Path
 from datetime import datetime
-from PIL import Image, ImageDraw, ImageFont
+from compact_art import CompactArt
 from constants import COLORS
+from profiling import stage
+from render_cache import get_default_cache
+
+# Characters that make a line render in the accent color
+SPECIAL_CHARS = '!?.,*#@$%&'
+
+# Extensions save_ascii_art_image writes; anything else is saved as PNG
+SAVE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.pdf', '.svg', '.ans')
+
+# Fonts tried in order to match the UI's Courier font
+FONT_CANDIDATES = ('Courier', 'Courier New')
+DEFAULT_FONT = 'default'
+FONT_CACHE_SIZE = 32
+
+# Smallest band of art lines drawn by one ascii_to_image_parallel task
+MIN_BAND_LINES = 64
+
+# Font registry: (font name, size) -> font, in least recently used order
+_font_cache = OrderedDict()
+_resolved_font_name = None
+
+
+def line_color(line):
+    """Return the color for a line: accent if it contains special characters, text otherwise."""
+    return COLORS['accent'] if any(c in SPECIAL_CHARS for c in line) else COLORS['text']
+
+
+def _open_font(font_name, font_size):
+    """Open a font by name or file path; DEFAULT_FONT selects Pillow's built-in font."""
+    from PIL import ImageFont
+    
+    if font_name == DEFAULT_FONT:
+        return ImageFont.load_default()
+    return ImageFont.truetype(font_name, font_size)
+
+
+def _resolve_font_name(font_size):
+    """Find the first loadable default font once and remember it for later calls."""
+    global _resolved_font_name
+    from PIL import ImageFont
+    
+    if _resolved_font_name is None:
+        override = os.environ.get('ASCII_ART_FONT')
+        for font_name in ((override,) if override else ()) + FONT_CANDIDATES:
+            try:
+                font = ImageFont.truetype(font_name, font_size)
+            except IOError:
+                continue
+            _font_cache[(font_name, font_size)] = font
+            _resolved_font_name = font_name
+            break
+        else:
+            # Fallback to default as last resort
+            _resolved_font_name = DEFAULT_FONT
+    
+    return _resolved_font_name
+
+
+def get_font(font_size, font_name=None):
+    """
+    Get a font from the module font registry, loading it on first use.
+    
+    Fonts are kept in an LRU cache keyed by (font name, size). Without an explicit
+    font, FONT_CANDIDATES (preceded by the ASCII_ART_FONT environment variable, if set)
+    are tried once and the first one that loads is reused, so failed lookups are
+    not repeated on later calls.
+    
+    Args:
+        font_size (int): Size of the font
+        font_name (str, optional): Font name or path to a font file. Defaults to None.
+        
+    Returns:
+        PIL.ImageFont: Loaded font
+    """
+    if font_name is None:
+        font_name = _resolve_font_name(font_size)
+    
+    key = (font_name, font_size)
+    font = _font_cache.get(key)
+    if font is None:
+        font = _open_font(font_name, font_size)
+        _font_cache[key] = font
+        if len(_font_cache) > FONT_CACHE_SIZE:
+            _font_cache.popitem(last=False)
+    else:
+        _font_cache.move_to_end(key)
+    
+    return font
+
 
+def resolved_font_name():
+    """Return the default font chosen by the registry, or None if not resolved yet."""
+    return _resolved_font_name
 
-def ascii_to_image(ascii_lines, pattern_char, font_size=12, padding=5):
+
+def warm_fonts(font_sizes=(12,), font_name=None):
+    """
+    Preload fonts into the registry, e.g. at application or worker startup.
+    
+    Args:
+        font_sizes (iterable, optional): Font sizes to load. Defaults to (12,).
+        font_name (str, optional): Font name or path to a font file. Defaults to None.
+    """
+    for font_size in font_sizes:
+        get_font(font_size, font_name)
+
+
+def _cell_size(font):
+    """Return the (width, height) of one monospaced character cell for a font."""
+    ascent, descent = font.getmetrics()
+    return max(1, round(font.getlength('M'))), max(1, ascent + descent)
+
+
+@lru_cache(maxsize=1024)
+def _glyph_tile(font, char, color):
+    """Pre-render a single character cell on the background color."""
+    from PIL import Image, ImageDraw
+    
+    tile = Image.new('RGB', _cell_size(font), COLORS['bg'])
+    ImageDraw.Draw(tile).text((0, 0), char, font=font, fill=color)
+    return tile
+
+
+def _rasterize(art_lines, font, padding, colors=None):
+    """
+    Build an image by pasting pre-rendered character tiles into one buffer.
+    
+    colors optionally gives the color of every line, e.g. computed from the full
+    lines when art_lines are slices of them; by default each line gets line_color.
+    """
+    from PIL import Image
+    
+    cell_width, cell_height = _cell_size(font)
+    columns = max(len(line) for line in art_lines)
+    img = Image.new('RGB',
+                    (columns * cell_width + padding * 2, len(art_lines) * cell_height + padding * 2),
+                    COLORS['bg'])
+    
+    if colors is None:
+        colors = map(line_color, art_lines)
+    y_position = padding
+    for line, color in zip(art_lines, colors):
+        for column, char in enumerate(line):
+            if char != ' ':
+                img.paste(_glyph_tile(font, char, color), (padding + column * cell_width, y_position))
+        y_position += cell_height
+    
+    return img
+
+
+@lru_cache(maxsize=256)
+def _run_strip(font, char, color, length):
+    """Pre-render a run of identical character cells as one strip."""
+    from PIL import Image
+    
+    tile = _glyph_tile(font, char, color)
+    cell_width, cell_height = tile.size
+    strip = Image.new('RGB', (cell_width * length, cell_height), COLORS['bg'])
+    for column in range(length):
+        strip.paste(tile, (column * cell_width, 0))
+    return strip
+
+
+def _rasterize_compact(art, rows, font, padding):
+    """Build an image from the runs of CompactArt, skipping blank cells entirely."""
+    from PIL import Image
+    
+    cell_width, cell_height = _cell_size(font)
+    columns = max(art.line_lengths[row] for row in rows)
+    img = Image.new('RGB',
+                    (columns * cell_width + padding * 2, len(rows) * cell_height + padding * 2),
+                    COLORS['bg'])
+    
+    # Multi-character patterns are drawn cell by cell like any other text
+    pattern = art.pattern_char if len(art.pattern_char) == 1 else None
+    y_position = padding
+    for row in rows:
+        color = COLORS['accent'] if art.row_contains(row, SPECIAL_CHARS) else COLORS['text']
+        for start, length, literal in art.iter_runs(row):
+            x_position = padding + start * cell_width
+            if literal is None and pattern is not None:
+                img.paste(_run_strip(font, pattern, color, length), (x_position, y_position))
+                continue
+            text = literal if literal is not None else art.pattern_char * (length // len(art.pattern_char))
+            for column, char in enumerate(text):
+                img.paste(_glyph_tile(font, char, color), (x_position + column * cell_width, y_position))
+        y_position += cell_height
+    
+    return img
+
+
+def mask_to_image(mask, pattern_char, font_size=12, padding=5, font_name=None):
+    """
+    Convert a boolean glyph mask (see bitmap_engine) directly to an image.
+    
+    The pattern character cell is rendered once and the whole image is
+    assembled with NumPy before a single Image.fromarray call.
+    
+    Args:
+        mask (numpy.ndarray): 2-D boolean mask; True marks drawn cells
+        pattern_char (str): Single character drawn for set cells
+        font_size (int): Size of the font (matches UI font size)
+        padding (int): Padding around the art (matches UI padding)
+        font_name (str, optional): Font name or path to a font file. Defaults to Courier.
+        
+    Returns:
+        PIL.Image: Generated image
+    """
+    import numpy as np
+    from PIL import Image
+    
+    font = get_font(font_size, font_name)
+    ink = np.asarray(_glyph_tile(font, pattern_char, line_color(pattern_char)))
+    background = np.asarray(Image.new('RGB', _cell_size(font), COLORS['bg']))
+    
+    rows, columns = mask.shape
+    cell_height, cell_width, _ = ink.shape
+    cells = np.where(mask[:, :, None, None, None], ink, background)
+    
+    # Single preallocated buffer filled with the background, art copied inside the padding
+    pixels = np.empty((rows * cell_height + padding * 2, columns * cell_width + padding * 2, 3),
+                      dtype=np.uint8)
+    pixels[...] = background[0, 0]
+    pixels[padding:padding + rows * cell_height, padding:padding + columns * cell_width] = \
+        cells.transpose(0, 2, 1, 3, 4).reshape(rows * cell_height, columns * cell_width, 3)
+    
+    return Image.fromarray(pixels, 'RGB')
+
+
+def filter_art_lines(ascii_lines):
+    """Yield the lines of ASCII art, skipping empty lines and info messages."""
+    for line in ascii_lines:
+        if line and not line.startswith('\n') and not line.startswith('Text was') and \
+                not line.startswith('ASCII art created'):
+            yield line
+
+
+def ascii_to_image(ascii_lines, pattern_char, font_size=12, padding=5, raster=False, font_name=None):
     """
     Convert ASCII art to an image.
     
     Args:
-        ascii_lines (list): Lines of ASCII art
+        ascii_lines (list or CompactArt): Lines of ASCII art
         pattern_char (str): The character used for the ASCII art
         font_size (int): Size of the font (matches UI font size)
         padding (int): Padding around the text (matches UI padding)
+        raster (bool): Paste pre-rendered character cells on a fixed grid instead of
+            laying out each line with Pillow text rendering. Much faster for large art.
+            CompactArt is rasterized run by run without decoding its lines.
+        font_name (str, optional): Font name or path to a font file. Defaults to Courier.
         
     Returns:
         PIL.Image: Generated image
     """
+    from PIL import Image, ImageDraw
+    
+    if raster and isinstance(ascii_lines, CompactArt):
+        # Empty lines are skipped, as filter_art_lines does for plain lines
+        rows = [row for row, length in enumerate(ascii_lines.line_lengths) if length]
+        if rows:
+            with stage('font_load'):
+                font = get_font(font_size, font_name)
+            with stage('draw'):
+                return _rasterize_compact(ascii_lines, rows, font, padding)
+    
     # Filter out empty lines and info messages
-    art_lines = [line for line in ascii_lines if line and not line.startswith('\n') and 
-                not line.startswith('Text was') and not line.startswith('ASCII art created')]
+    art_lines = list(filter_art_lines(ascii_lines))
     
     if not art_lines:
         # If no valid art lines, create a simple message
         art_lines = ["No ASCII art to export"]
     
     # Use Courier font to match UI exactly
-    try:
-        font = ImageFont.truetype('Courier', font_size)
-    except IOError:
-        try:
-            font = ImageFont.truetype('Courier New', font_size)
-        except IOError:
-            # Fallback to default as last resort
-            font = ImageFont.load_default()
+    with stage('font_load'):
+        font = get_font(font_size, font_name)
+    
+    if raster:
+        with stage('draw'):
+            return _rasterize(art_lines, font, padding)
     
     # Calculate image size based on text
     max_width = 0
@@ -49,10 +305,11 @@ def ascii_to_image(ascii_lines, pattern_char, font_size=12, padding=5):
     temp_img = Image.new('RGB', (1, 1), COLORS['bg'])
     temp_draw = ImageDraw.Draw(temp_img)
     
-    for line in art_lines:
-        width, height = temp_draw.textbbox((0, 0), line, font=font)[2:]
-        max_width = max(max_width, width)
-        total_height += height
+    with stage('measure'):
+        for line in art_lines:
+            width, height = temp_draw.textbbox((0, 0), line, font=font)[2:]
+            max_width = max(max_width, width)
+            total_height += height
     
     # Add padding
     img_width = max_width + (padding * 2)
@@ -63,34 +320,231 @@ def ascii_to_image(ascii_lines, pattern_char, font_size=12, padding=5):
     draw = ImageDraw.Draw(img)
     
     # Draw the ASCII art with special character coloring
-    y_position = padding
-    for line in art_lines:
-        # Use red color for special characters, black for regular text
-        text_color = COLORS['accent'] if any(c in '!?.,*#@$%&' for c in line) else COLORS['text']
-        draw.text((padding, y_position), line, font=font, fill=text_color)
-        _, _, _, line_height = draw.textbbox((padding, y_position), line, font=font)
-        y_position = line_height
+    with stage('draw'):
+        y_position = padding
+        for line in art_lines:
+            # Use red color for special characters, black for regular text
+            text_color = line_color(line)
+            draw.text((padding, y_position), line, font=font, fill=text_color)
+            _, _, _, line_height = draw.textbbox((padding, y_position), line, font=font)
+            y_position = line_height
     
     return img
 
 
-def save_ascii_art_image(ascii_lines, pattern_char, filename=None, download_folder=None):
+def _rasterize_band(band, font_size, font_name):
+    """Rasterize one band of art without padding. Runs inside a worker process."""
+    font = get_font(font_size, font_name)
+    if isinstance(band, CompactArt):
+        rows = [row for row, length in enumerate(band.line_lengths) if length]
+        if not rows:
+            return None
+        img = _rasterize_compact(band, rows, font, 0)
+    else:
+        img = _rasterize(band, font, 0)
+    return img.size, img.tobytes()
+
+
+def ascii_to_image_parallel(ascii_lines, pattern_char, font_size=12, padding=5, font_name=None,
+                            workers=None, band_lines=None, executor=None):
+    """
+    Rasterize large ASCII art on several cores, one band of lines per task.
+    
+    Produces the same image as ascii_to_image(..., raster=True). Bands are drawn in
+    worker processes, since cell pasting runs in Python and holds the GIL, and are
+    pasted into the final image in order as their pixels arrive.
+    
+    Args:
+        ascii_lines (list or CompactArt): Lines of ASCII art
+        pattern_char (str): The character used for the ASCII art
+        font_size (int): Size of the font (matches UI font size)
+        padding (int): Padding around the text (matches UI padding)
+        font_name (str, optional): Font name or path to a font file. Defaults to Courier.
+        workers (int, optional): Worker processes. Defaults to the CPU count.
+        band_lines (int, optional): Art lines per band. Defaults to four bands per
+            worker, with at least MIN_BAND_LINES lines each.
+        executor (concurrent.futures.Executor, optional): Process pool to draw the bands
+            on instead of starting one for this call.
+        
+    Returns:
+        PIL.Image: Generated image
+    """
+    from PIL import Image
+    
+    compact = isinstance(ascii_lines, CompactArt)
+    if compact:
+        lengths = ascii_lines.line_lengths
+    else:
+        ascii_lines = list(filter_art_lines(ascii_lines))
+        lengths = [len(line) for line in ascii_lines]
+    drawn_rows = sum(1 for length in lengths if length)
+    
+    workers = workers or os.cpu_count() or 1
+    if band_lines is None:
+        band_lines = max(MIN_BAND_LINES, -(-len(lengths) // (workers * 4)))
+    if not drawn_rows or len(lengths) <= band_lines or (workers == 1 and executor is None):
+        return ascii_to_image(ascii_lines, pattern_char, font_size, padding, raster=True,
+                              font_name=font_name)
+    
+    with stage('font_load'):
+        font = get_font(font_size, font_name)
+    cell_width, cell_height = _cell_size(font)
+    img = Image.new('RGB',
+                    (max(lengths) * cell_width + padding * 2, drawn_rows * cell_height + padding * 2),
+                    COLORS['bg'])
+    
+    # Empty lines are not drawn, so each band starts below the lines drawn before it
+    bands = []
+    band_rows = []
+    drawn_before = 0
+    for start in range(0, len(lengths), band_lines):
+        bands.append(ascii_lines.rows(start, start + band_lines) if compact
+                     else ascii_lines[start:start + band_lines])
+        band_rows.append(drawn_before)
+        drawn_before += sum(1 for length in lengths[start:start + band_lines] if length)
+    
+    own_executor = executor is None
+    if own_executor:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=min(workers, len(bands)))
+    try:
+        with stage('draw'):
+            results = executor.map(_rasterize_band, bands, repeat(font_size), repeat(font_name))
+            for row, result in zip(band_rows, results):
+                if result is not None:
+                    size, data = result
+                    img.paste(Image.frombytes('RGB', size, data),
+                              (padding, padding + row * cell_height))
+    finally:
+        if own_executor:
+            executor.shutdown()
+    
+    return img
+
+
+@contextmanager
+def _replacing(file_path):
+    """
+    Yield a temporary path next to file_path that replaces file_path once written.
+    
+    Exports never rewrite an existing file in place, since it may be a hardlink to a
+    render cache entry.
+    """
+    directory, name = os.path.split(file_path)
+    temp_path = os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        yield temp_path
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.lexists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def export_ascii_art(ascii_lines, pattern_char, fmt='png', buffer=None, raster=False,
+                     font_name=None, vector=False, workers=None):
+    """
+    Encode ASCII art in memory, without touching the filesystem.
+    
+    Args:
+        ascii_lines (list): Lines of ASCII art
+        pattern_char (str): The character used for the ASCII art
+        fmt (str, optional): One of 'png', 'jpg'/'jpeg', 'pdf', 'svg' or 'ans'. Defaults to 'png'.
+        buffer (file-like, optional): Writable binary stream (e.g. io.BytesIO or a socket file)
+            to write the encoded data into. Formats that need to seek while encoding are
+            encoded in memory first for streams that cannot seek. Defaults to None.
+        raster (bool, optional): Use the fast cell raster mode of ascii_to_image. Defaults to False.
+        font_name (str, optional): Font name or path to a font file. Defaults to Courier.
+        vector (bool, optional): Write PDF as real text instead of a 300 dpi bitmap. Defaults to False.
+        workers (int, optional): With raster, draw the image in bands on this many processes
+            (see ascii_to_image_parallel). Defaults to None.
+        
+    Returns:
+        bytes or file-like: The encoded data, or the buffer it was written into
+    """
+    fmt = fmt.lower().lstrip('.')
+    if fmt == 'jpeg':
+        fmt = 'jpg'
+    if f'.{fmt}' not in SAVE_EXTENSIONS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    
+    if buffer is None:
+        with io.BytesIO() as output:
+            _write_export(ascii_lines, pattern_char, fmt, output, raster, font_name, vector, workers)
+            return output.getvalue()
+    
+    seekable = getattr(buffer, 'seekable', None)
+    if seekable is not None and seekable():
+        _write_export(ascii_lines, pattern_char, fmt, buffer, raster, font_name, vector, workers)
+    else:
+        # Pillow's PDF writer seeks back to patch offsets, which sockets and pipes cannot do
+        buffer.write(export_ascii_art(ascii_lines, pattern_char, fmt, None, raster, font_name,
+                                      vector, workers))
+    return buffer
+
+
+def _is_text_native(fmt, vector):
+    """Return True for formats written as text, without rasterizing or loading a font."""
+    return fmt in ('svg', 'ans') or (fmt == 'pdf' and vector)
+
+
+def _write_export(ascii_lines, pattern_char, fmt, fp, raster, font_name, vector, workers=None):
+    """Render ASCII art and write it in the given format to a binary file object."""
+    # Text-native formats are written directly without rasterizing
+    if _is_text_native(fmt, vector):
+        from vector_export import ascii_to_ansi, ascii_to_pdf, ascii_to_svg
+        
+        with stage('encode'):
+            if fmt == 'svg':
+                fp.write(ascii_to_svg(ascii_lines).encode('utf-8'))
+            elif fmt == 'ans':
+                fp.write(ascii_to_ansi(ascii_lines).encode('utf-8'))
+            else:
+                fp.write(ascii_to_pdf(ascii_lines))
+        return
+    
+    # Create image from ASCII art
+    if raster and workers and workers > 1:
+        img = ascii_to_image_parallel(ascii_lines, pattern_char, font_name=font_name, workers=workers)
+    else:
+        img = ascii_to_image(ascii_lines, pattern_char, raster=raster, font_name=font_name)
+    
+    # Handle different file formats
+    with stage('encode'):
+        if fmt == 'jpg':
+            img.save(fp, 'JPEG', quality=95)
+        elif fmt == 'pdf':
+            # Convert to RGB mode for PDF
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            img.save(fp, 'PDF', resolution=300.0)
+        else:
+            img.save(fp, 'PNG')
+
+
+def save_ascii_art_image(ascii_lines, pattern_char, filename=None, download_folder=None, raster=False,
+                         font_name=None, vector=False, cache=None, workers=None):
     """
     Save ASCII art as an image in the downloads folder.
-    Supports JPG, PNG, and PDF formats.
+    Supports JPG, PNG and PDF formats, plus text-native SVG (.svg) and ANSI (.ans) output.
+    Use export_ascii_art to get the encoded data in memory instead.
     
     Args:
         ascii_lines (list): Lines of ASCII art
         pattern_char (str): The character used for the ASCII art
         filename (str, optional): Custom filename. Defaults to None.
         download_folder (str, optional): Custom download folder path. Defaults to None.
+        raster (bool, optional): Use the fast cell raster mode of ascii_to_image. Defaults to False.
+        font_name (str, optional): Font name or path to a font file. Defaults to Courier.
+        vector (bool, optional): Write PDF as real text instead of a 300 dpi bitmap. Defaults to False.
+        cache (RenderCache, optional): Render cache to reuse identical exports from. Defaults to
+            the cache configured by ASCII_ART_CACHE_DIR, if any.
+        workers (int, optional): With raster, draw the image in bands on this many processes
+            (see ascii_to_image_parallel). Defaults to None.
         
     Returns:
         str: Path to the saved image
     """
-    # Create image from ASCII art
-    img = ascii_to_image(ascii_lines, pattern_char)
-    
     # Determine download folder
     if not download_folder:
         download_folder = str(Path.home() / "Downloads")
@@ -103,22 +557,157 @@ def save_ascii_art_image(ascii_lines, pattern_char, filename=None, download_fold
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"ascii_art_{timestamp}"
     
-    # Handle different file formats based on extension
-    if filename.lower().endswith(('.jpg', '.jpeg')):
-        file_path = os.path.join(download_folder, filename)
-        img.save(file_path, 'JPEG', quality=95)
-    elif filename.lower().endswith('.png'):
+    # Default to PNG if no supported extension provided
+    extension = os.path.splitext(filename)[1].lower()
+    if extension not in SAVE_EXTENSIONS:
+        filename = f"{filename}.png"
+        extension = '.png'
+    file_path = os.path.join(download_folder, filename)
+    
+    # Reuse an identical earlier export instead of rendering and encoding again
+    if cache is None:
+        cache = get_default_cache()
+    if cache is not None:
+        ascii_lines = list(ascii_lines)
+        # Only raster output depends on the font; resolving it would import Pillow
+        if _is_text_native(extension[1:], vector):
+            font_key = 'text'
+        else:
+            font_key = font_name or _resolve_font_name(12)
+        cache_key = cache.key(ascii_lines, pattern_char, extension=extension, raster=raster,
+                              font_name=font_key, vector=vector)
+        with stage('cache_lookup'):
+            hit = cache.fetch(cache_key, file_path)
+        if hit:
+            return file_path
+    
+    with _replacing(file_path) as temp_path, open(temp_path, 'wb') as f:
+        _write_export(ascii_lines, pattern_char, extension[1:], f, raster, font_name, vector, workers)
+    
+    if cache is not None:
+        cache.store(cache_key, file_path)
+    
+    return file_path
+
+
+def iter_art_tiles(ascii_lines, lines_per_tile=200, columns_per_tile=None):
+    """
+    Split ASCII art into tiles, consuming the lines lazily one band at a time.
+    
+    Args:
+        ascii_lines (iterable): Lines of ASCII art, e.g. a list or ASCIIArt.iter_art()
+        lines_per_tile (int, optional): Art lines per tile. Defaults to 200.
+        columns_per_tile (int, optional): Art columns per tile, or None for full-width
+            horizontal bands. Defaults to None.
+        
+    Yields:
+        tuple: (tile row, tile column, list of tile lines)
+    """
+    for tile_row, tile_column, tile_lines, _ in _iter_tiles(ascii_lines, lines_per_tile,
+                                                            columns_per_tile):
+        yield tile_row, tile_column, tile_lines
+
+
+def _iter_tiles(ascii_lines, lines_per_tile, columns_per_tile):
+    """iter_art_tiles, also yielding the color of every tile line, taken from its full line."""
+    lines = filter_art_lines(ascii_lines)
+    tile_row = 0
+    
+    while True:
+        band = list(islice(lines, lines_per_tile))
+        if not band:
+            return
+        
+        colors = [line_color(line) for line in band]
+        if columns_per_tile is None:
+            yield tile_row, 0, band, colors
+        else:
+            width = max(len(line) for line in band)
+            for tile_column, start in enumerate(range(0, width, columns_per_tile)):
+                # Pad slices so every tile of a band has the same size on the cell grid
+                tile_width = min(columns_per_tile, width - start)
+                yield tile_row, tile_column, [line[start:start + columns_per_tile].ljust(tile_width)
+                                              for line in band], colors
+        tile_row += 1
+
+
+def save_ascii_art_tiles(ascii_lines, pattern_char, filename=None, download_folder=None,
+                         lines_per_tile=200, columns_per_tile=None, font_size=12, font_name=None):
+    """
+    Save large ASCII art tile by tile, so peak memory is bounded by the tile size.
+    
+    Tiles are rendered with the raster mode of ascii_to_image so they line up on one
+    cell grid, and each tile is released before the next one is rendered:
+    - .pdf: one page per tile, streamed into Pillow's multi-page save_all writer, which
+      keeps the page images until the document is written
+    - .tif/.tiff: one frame per tile in a multi-page TIFF
+    - .png/.jpg/.jpeg or no extension: a directory of tile images named
+      tile_<row>_<column>.<ext>
+    
+    A line keeps the color of the full line in every column tile. Art without any
+    lines is saved as one "No ASCII art to export" tile.
+    
+    Args:
+        ascii_lines (iterable): Lines of ASCII art, e.g. a list or ASCIIArt.iter_art()
+        pattern_char (str): The character used for the ASCII art
+        filename (str, optional): Custom filename. Defaults to None.
+        download_folder (str, optional): Custom download folder path. Defaults to None.
+        lines_per_tile (int, optional): Art lines per tile. Defaults to 200.
+        columns_per_tile (int, optional): Art columns per tile, or None for full-width bands.
+        font_size (int, optional): Size of the font. Defaults to 12.
+        font_name (str, optional): Font name or path to a font file. Defaults to Courier.
+        
+    Returns:
+        str: Path to the saved document or tile directory
+    """
+    if not download_folder:
+        download_folder = str(Path.home() / "Downloads")
+    os.makedirs(download_folder, exist_ok=True)
+    
+    if not filename:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"ascii_art_{timestamp}"
+    
+    stem, extension = os.path.splitext(filename)
+    extension = extension.lower()
+    
+    def render_tiles():
+        font = get_font(font_size, font_name)
+        empty = True
+        for row, column, lines, colors in _iter_tiles(ascii_lines, lines_per_tile, columns_per_tile):
+            empty = False
+            yield row, column, _rasterize(lines, font, 5, colors)
+        if empty:
+            # A single message tile, as ascii_to_image draws for empty art
+            yield 0, 0, ascii_to_image([], pattern_char, font_size=font_size, raster=True,
+                                       font_name=font_name)
+    
+    tiles = render_tiles()
+    
+    if extension == '.pdf':
         file_path = os.path.join(download_folder, filename)
-        img.save(file_path, 'PNG')
-    elif filename.lower().endswith('.pdf'):
+        # One save_all pass; appending page by page would rewrite the page tree every time
+        pages = (img for _, _, img in tiles)
+        with _replacing(file_path) as temp_path:
+            next(pages).save(temp_path, 'PDF', resolution=300.0, save_all=True, append_images=pages)
+    elif extension in ('.tif', '.tiff'):
+        from PIL import TiffImagePlugin
+        
         file_path = os.path.join(download_folder, filename)
-        # Convert to RGB mode for PDF
-        if img.mode != 'RGB':
-            img = img.convert('RGB')
-        img.save(file_path, 'PDF', resolution=300.0)
+        with _replacing(file_path) as temp_path, \
+                TiffImagePlugin.AppendingTiffWriter(temp_path, new=True) as tiff:
+            for _, _, img in tiles:
+                img.save(tiff, 'TIFF', compression='tiff_deflate')
+                tiff.newFrame()
     else:
-        # Default to PNG if no extension provided
-        file_path = os.path.join(download_folder, f"{filename}.png")
-        img.save(file_path, 'PNG')
+        file_path = os.path.join(download_folder, stem if extension else filename)
+        os.makedirs(file_path, exist_ok=True)
+        is_jpeg = extension in ('.jpg', '.jpeg')
+        for row, column, img in tiles:
+            tile_path = os.path.join(file_path, f"tile_{row:04d}_{column:04d}{'.jpg' if is_jpeg else '.png'}")
+            if is_jpeg:
+                img.save(tile_path, 'JPEG', quality=95)
+            else:
+                img.save(tile_path, 'PNG')
     
-    return file_path
\ No newline at end of file
+    return file_path
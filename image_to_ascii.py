@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Image To ASCII Module
+This module converts photos and logos to ASCII art.
+
+The image is resampled to the character grid with a box filter, correcting for
+the character cell aspect ratio, and every cell's luminance is mapped to a
+character ramp with NumPy lookups. Large images are converted strip by strip, so
+only one strip of resampled pixels is held at a time, and JPEG images are decoded
+at a reduced scale when the grid is much smaller than the image.
+
+The resulting lines work with the existing exporters (ascii_to_image,
+save_ascii_art_image, export_ascii_art) like generated text art.
+"""
+import numpy as np
+from PIL import Image
+from constants import COLORS
+
+# Characters from darkest to lightest. Characters that exporters highlight in the
+# accent color (see image_export.SPECIAL_CHARS) are left out so photos stay monochrome.
+DEFAULT_RAMP = "MWN0KOkxdolc;:~-' "
+
+# Width of a character cell divided by its height (Courier cells are 0.6 x 1.2 em)
+CHAR_ASPECT = 0.5
+
+# Art lines resampled and converted per strip
+STRIP_ROWS = 64
+
+
+def grid_size(image_size, columns, char_aspect=CHAR_ASPECT):
+    """
+    Compute the character grid for an image.
+
+    Args:
+        image_size (tuple): Image (width, height) in pixels
+        columns (int): Art width in characters
+        char_aspect (float, optional): Character cell width / height. Defaults to 0.5.
+
+    Returns:
+        tuple: (columns, rows) keeping the image's aspect ratio on screen
+    """
+    width, height = image_size
+    columns = max(1, min(columns, width))
+    rows = max(1, round(height * columns * char_aspect / width))
+    return columns, rows
+
+
+def luminance_to_lines(luminance, ramp=DEFAULT_RAMP):
+    """
+    Map a 2-D array of luminance values to lines of ramp characters.
+
+    Args:
+        luminance (numpy.ndarray): uint8 luminance, one value per character cell
+        ramp (str, optional): Characters from darkest to lightest. Defaults to DEFAULT_RAMP.
+
+    Returns:
+        list: Lines of ASCII art, one per array row
+    """
+    if not ramp:
+        raise ValueError("Character ramp must not be empty")
+
+    table = np.frombuffer(ramp.encode('utf-32-le'), dtype='<u4')
+    # 0..255 scaled to 0..len(ramp) - 1 with integer arithmetic
+    indices = (luminance.astype(np.uint32) * len(ramp)) >> 8
+    code_points = table[indices]
+    return [row.tobytes().decode('utf-32-le') for row in code_points]
+
+
+def _to_8bit(img):
+    """
+    Scale a 16/32-bit integer or float grayscale image to 8-bit 'L'.
+
+    Pillow's own conversion clips these modes at 255 instead of scaling them.
+    Integer images are taken as 16-bit unless all values fit in 8 bits, float
+    images as 0..1 unless values exceed 1.
+    """
+    _, high = img.getextrema()
+    if img.mode == 'F':
+        scale = 255 if high <= 1 else 1
+    else:
+        scale = 255 / 65535 if img.mode.startswith('I;16') or high > 255 else 1
+    values = np.asarray(img, dtype=np.float32) * scale
+    return Image.fromarray(np.clip(np.rint(values), 0, 255).astype(np.uint8), 'L')
+
+
+def _prepare(img):
+    """Convert an image to a mode the box filter can resample."""
+    if img.mode in ('I', 'F') or img.mode.startswith('I;16'):
+        return _to_8bit(img)
+    has_alpha = 'A' in img.getbands() or 'transparency' in img.info
+    if has_alpha and img.mode != 'RGBA':
+        img = img.convert('RGBA')
+    elif not has_alpha and img.mode not in ('L', 'RGB'):
+        img = img.convert('RGB')
+    return img
+
+
+def _strip_luminance(strip):
+    """Convert a resampled strip to luminance, with transparency shown as the background."""
+    if strip.mode == 'RGBA':
+        background = Image.new('RGBA', strip.size, COLORS['bg'])
+        strip = Image.alpha_composite(background, strip)
+    return np.asarray(strip.convert('L'))
+
+
+def iter_image_ascii(source, columns=80, ramp=DEFAULT_RAMP, invert=False,
+                     char_aspect=CHAR_ASPECT, strip_rows=STRIP_ROWS):
+    """
+    Convert an image to ASCII art, yielding lines strip by strip.
+
+    Args:
+        source (str, file-like or PIL.Image): Image path, binary file object or open image
+        columns (int, optional): Art width in characters. Defaults to 80.
+        ramp (str, optional): Characters from darkest to lightest. Defaults to DEFAULT_RAMP.
+        invert (bool, optional): Map dark pixels to light characters, for light text on
+            a dark background such as most terminals. Defaults to False.
+        char_aspect (float, optional): Character cell width / height. Defaults to 0.5.
+        strip_rows (int, optional): Art lines converted at a time. Defaults to 64.
+
+    Yields:
+        str: Lines of ASCII art
+    """
+    if invert:
+        ramp = ramp[::-1]
+    opened = not isinstance(source, Image.Image)
+    original = Image.open(source) if opened else source
+    try:
+        columns, rows = grid_size(original.size, columns, char_aspect)
+        if opened:
+            # JPEG images decode at 1/2, 1/4 or 1/8 scale if that leaves several pixels per cell
+            original.draft('RGB', (columns * 4, rows * 4))
+        img = _prepare(original)
+        width, height = img.size
+        # Strips are cut at exact fractional source rows, so the box filter averages
+        # the same pixels as one resize of the whole image would
+        line_height = height / rows
+        for start in range(0, rows, strip_rows):
+            stop = min(rows, start + strip_rows)
+            strip = img.resize((columns, stop - start), Image.BOX,
+                               box=(0, start * line_height, width, min(height, stop * line_height)))
+            yield from luminance_to_lines(_strip_luminance(strip), ramp)
+    finally:
+        if opened:
+            original.close()
+
+
+def image_to_ascii(source, columns=80, ramp=DEFAULT_RAMP, invert=False, char_aspect=CHAR_ASPECT):
+    """
+    Convert an image to ASCII art.
+
+    Args:
+        source (str, file-like or PIL.Image): Image path, binary file object or open image
+        columns (int, optional): Art width in characters. Defaults to 80.
+        ramp (str, optional): Characters from darkest to lightest. Defaults to DEFAULT_RAMP.
+        invert (bool, optional): Map dark pixels to light characters. Defaults to False.
+        char_aspect (float, optional): Character cell width / height. Defaults to 0.5.
+
+    Returns:
+        list: Lines of ASCII art
+    """
+    return list(iter_image_ascii(source, columns, ramp, invert, char_aspect))
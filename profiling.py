@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Profiling Module
+This module provides opt-in timing and memory instrumentation for the render pipeline.
+
+Stages of the pipeline are wrapped in stage(name) blocks, which cost a single
+function call while profiling is disabled. Enable profiling either with the
+profile() context manager:
+
+    with profiling.profile():
+        save_ascii_art_image(lines, '*')
+    print(profiling.summary())
+
+or for a whole process with environment variables, written out at exit:
+
+    ASCII_ART_PROFILE=summary.json ASCII_ART_TRACE=trace.json python -m ascii_art render jobs.txt
+
+Worker processes write their own files with the process id appended to the path.
+Set ASCII_ART_PROFILE_MEMORY=0 to skip tracemalloc memory tracking.
+
+Memory is reported as the peak traced memory of a stage above the traced memory
+when it started. tracemalloc only sees allocations made through Python's allocator
+(including NumPy arrays); Pillow image buffers are allocated outside of it and
+do not count.
+
+The trace file uses the Chrome trace event format (chrome://tracing, Perfetto).
+"""
+import atexit
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+# Maximum number of trace events kept; the summary keeps aggregating past this limit
+MAX_EVENTS = 1_000_000
+
+_enabled = False
+_trace_memory = False
+# tracemalloc module, set when memory tracing is first enabled
+_tracemalloc = None
+# Stages being recorded, whose peaks must survive tracemalloc.reset_peak() calls
+_open_stages = []
+_events = []
+_totals = {}
+_lock = threading.Lock()
+_null_stage = nullcontext()
+# Output paths of a forked worker, registered for writing on its first recorded stage
+_worker_output = None
+
+
+class _Stage:
+    """Context manager recording wall time and peak traced memory of one stage."""
+
+    __slots__ = ('name', 'start', 'memory', 'peak')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        if _trace_memory:
+            with _lock:
+                # Keep the peaks of enclosing stages before the peak is reset for this one
+                self.memory, peak = _tracemalloc.get_traced_memory()
+                for stage in _open_stages:
+                    stage.peak = max(stage.peak, peak)
+                _tracemalloc.reset_peak()
+                self.peak = self.memory
+                _open_stages.append(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        duration = time.perf_counter_ns() - self.start
+        peak_bytes = 0
+        if _trace_memory and self in _open_stages:
+            with _lock:
+                _open_stages.remove(self)
+                peak_bytes = max(self.peak, _tracemalloc.get_traced_memory()[1]) - self.memory
+        _record(self.name, self.start, duration, peak_bytes)
+        return False
+
+
+def _record(name, start, duration, peak_bytes):
+    """Add a finished stage to the trace events and the per-stage totals."""
+    if _worker_output is not None:
+        _register_worker_output()
+    with _lock:
+        if len(_events) < MAX_EVENTS:
+            _events.append((name, start, duration, peak_bytes, os.getpid(), threading.get_ident()))
+        totals = _totals.get(name)
+        if totals is None:
+            totals = _totals[name] = {'calls': 0, 'total_ns': 0, 'max_ns': 0, 'peak_bytes': 0}
+        totals['calls'] += 1
+        totals['total_ns'] += duration
+        totals['max_ns'] = max(totals['max_ns'], duration)
+        totals['peak_bytes'] = max(totals['peak_bytes'], peak_bytes)
+
+
+def stage(name):
+    """
+    Instrument a block of the render pipeline.
+
+    Args:
+        name (str): Stage name, e.g. 'glyph_lookup' or 'encode'
+
+    Returns:
+        context manager: Records the block while profiling is enabled, no-op otherwise
+    """
+    if not _enabled:
+        return _null_stage
+    return _Stage(name)
+
+
+def is_enabled():
+    """Return True while profiling is enabled."""
+    return _enabled
+
+
+def enable(trace_memory=True):
+    """
+    Start recording stages.
+
+    Args:
+        trace_memory (bool, optional): Also record the peak traced memory per stage with
+            tracemalloc, which slows the program down noticeably. Defaults to True.
+    """
+    global _enabled, _trace_memory, _tracemalloc
+    if trace_memory:
+        # Imported on first use: tracemalloc loads pickle and linecache, which the
+        # render pipeline does not otherwise need
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        _tracemalloc = tracemalloc
+    _trace_memory = trace_memory
+    _enabled = True
+
+
+def disable():
+    """Stop recording stages. Recorded data is kept until reset()."""
+    global _enabled
+    _enabled = False
+
+
+def reset():
+    """Discard all recorded stages."""
+    with _lock:
+        _events.clear()
+        _totals.clear()
+
+
+@contextmanager
+def profile(trace_memory=True):
+    """
+    Record the stages run inside a with block, discarding earlier recordings.
+
+    Args:
+        trace_memory (bool, optional): Also record peak traced memory per stage. Defaults to True.
+    """
+    was_enabled = _enabled
+    reset()
+    enable(trace_memory)
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def summary():
+    """
+    Summarize recorded stages.
+
+    Returns:
+        dict: Stage name -> calls, total_ms, mean_ms, max_ms and peak_bytes (the largest
+            peak of traced memory above the stage's starting point, over all calls)
+    """
+    with _lock:
+        return {
+            name: {
+                'calls': totals['calls'],
+                'total_ms': totals['total_ns'] / 1e6,
+                'mean_ms': totals['total_ns'] / totals['calls'] / 1e6,
+                'max_ms': totals['max_ns'] / 1e6,
+                'peak_bytes': totals['peak_bytes'],
+            }
+            for name, totals in _totals.items()
+        }
+
+
+def chrome_trace():
+    """
+    Export recorded stages as Chrome trace events.
+
+    Returns:
+        dict: Trace document with one complete ('X') event per stage
+    """
+    with _lock:
+        events = list(_events)
+    return {
+        'traceEvents': [
+            {
+                'name': name,
+                'cat': 'ascii_art',
+                'ph': 'X',
+                'ts': start / 1e3,
+                'dur': duration / 1e3,
+                'pid': pid,
+                'tid': tid,
+                'args': {'peak_bytes': peak_bytes},
+            }
+            for name, start, duration, peak_bytes, pid, tid in events
+        ],
+        'displayTimeUnit': 'ms',
+    }
+
+
+def write_summary(path):
+    """Write summary() as JSON to a file."""
+    import json
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(summary(), f, indent=2)
+
+
+def write_chrome_trace(path):
+    """Write chrome_trace() as JSON to a file."""
+    import json
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(chrome_trace(), f)
+
+
+def _write_at_exit(summary_path, trace_path):
+    if summary_path:
+        write_summary(summary_path)
+    if trace_path:
+        write_chrome_trace(trace_path)
+
+
+def _worker_paths(summary_path, trace_path):
+    """Suffix output paths with the pid so worker processes do not overwrite each other."""
+    pid = os.getpid()
+    return summary_path and f"{summary_path}.{pid}", trace_path and f"{trace_path}.{pid}"
+
+
+def _after_fork_in_child(summary_path, trace_path):
+    """Start a fresh recording in forked workers, to be written when the worker exits."""
+    global _worker_output
+    reset()
+    _worker_output = _worker_paths(summary_path, trace_path)
+
+
+def _register_worker_output():
+    """Write a forked worker's recording at exit."""
+    global _worker_output
+    # Pool workers leave through os._exit, which skips atexit but runs multiprocessing
+    # finalizers. Registering after the fork, on first use, keeps the registration from
+    # being cleared by multiprocessing's own after-fork cleanup.
+    from multiprocessing.util import Finalize
+
+    paths, _worker_output = _worker_output, None
+    Finalize(None, _write_at_exit, args=paths, exitpriority=0)
+
+
+def _enable_from_environment():
+    """Enable profiling for the whole process if ASCII_ART_PROFILE or ASCII_ART_TRACE is set."""
+    summary_path = os.environ.get('ASCII_ART_PROFILE')
+    trace_path = os.environ.get('ASCII_ART_TRACE')
+    if not (summary_path or trace_path):
+        return
+
+    main_pid = os.environ.setdefault('_ASCII_ART_PROFILE_PID', str(os.getpid()))
+    if main_pid != str(os.getpid()):
+        # Spawned worker process
+        summary_path, trace_path = _worker_paths(summary_path, trace_path)
+    enable(trace_memory=os.environ.get('ASCII_ART_PROFILE_MEMORY', '1') != '0')
+    atexit.register(_write_at_exit, summary_path, trace_path)
+    if hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=lambda: _after_fork_in_child(summary_path, trace_path))
+
+
+_enable_from_environment()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Render Cache Module
+This module provides a persistent, content-addressed cache of exported ASCII art files.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+# Default size limit of a cache directory
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+# Fraction of the size limit kept after an eviction pass, so evictions are batched
+EVICTION_TARGET = 0.9
+
+_default_cache = None
+
+
+class RenderCache:
+    """
+    On-disk cache of exported files keyed by a hash of the art and render parameters.
+
+    Entries are evicted least recently used first once the directory grows past
+    max_bytes; a cache hit refreshes the entry's modification time. Cached files
+    are hardlinked to their destination where possible, so exported files must
+    be replaced rather than modified in place.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Open (and create if needed) a cache directory.
+
+        Args:
+            directory (str): Cache directory
+            max_bytes (int, optional): Size limit of the cache. Defaults to 512 MiB.
+        """
+        self.directory = str(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+        self._total_bytes = sum(size for _, size, _ in self._entries())
+
+    @staticmethod
+    def key(ascii_lines, pattern_char, **params):
+        """
+        Compute the cache key for a render.
+
+        Args:
+            ascii_lines (list): Lines of ASCII art
+            pattern_char (str): The character used for the ASCII art
+            **params: Any other parameters that affect the exported file
+
+        Returns:
+            str: Hex digest identifying the render
+        """
+        digest = hashlib.sha256()
+        digest.update(json.dumps([pattern_char, sorted(params.items())]).encode('utf-8'))
+        for line in ascii_lines:
+            digest.update(b'\n')
+            digest.update(line.encode('utf-8', errors='surrogatepass'))
+        return digest.hexdigest()
+
+    def _path(self, key, destination):
+        return os.path.join(self.directory, key + os.path.splitext(destination)[1].lower())
+
+    def _entries(self):
+        """Yield (path, size, mtime) for every cached file."""
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.startswith('.'):
+                    stat = entry.stat()
+                    yield entry.path, stat.st_size, stat.st_mtime
+
+    def fetch(self, key, destination):
+        """
+        Place a cached file at the destination path if the render is cached.
+
+        Args:
+            key (str): Cache key from RenderCache.key
+            destination (str): Path the exported file should be written to
+
+        Returns:
+            bool: True on a cache hit, False on a miss
+        """
+        path = self._path(key, destination)
+        try:
+            # Refresh recency for LRU eviction; fails if the entry does not exist
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return False
+
+        if os.path.lexists(destination):
+            os.remove(destination)
+        try:
+            try:
+                os.link(path, destination)
+            except FileNotFoundError:
+                raise
+            except OSError:
+                # Different filesystem or no hardlink support
+                shutil.copyfile(path, destination)
+        except FileNotFoundError:
+            # Evicted by another process sharing the cache directory since utime
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def store(self, key, source):
+        """
+        Add an exported file to the cache and evict old entries if over the size limit.
+
+        Args:
+            key (str): Cache key from RenderCache.key
+            source (str): Path of the exported file
+        """
+        path = self._path(key, source)
+        try:
+            # A replaced entry no longer counts towards the cache size
+            self._total_bytes -= os.path.getsize(path)
+        except FileNotFoundError:
+            pass
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix='.tmp')
+        os.close(fd)
+        try:
+            shutil.copyfile(source, temp_path)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        self._total_bytes += os.path.getsize(path)
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        """Remove least recently used entries until the cache is below its size limit."""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        limit = self.max_bytes * EVICTION_TARGET
+
+        for path, size, _ in entries:
+            if total <= limit:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._total_bytes = total
+
+    def clear(self):
+        """Remove every cached file."""
+        for path, _, _ in list(self._entries()):
+            os.remove(path)
+        self._total_bytes = 0
+
+    def stats(self):
+        """
+        Report cache usage for this process.
+
+        Returns:
+            dict: Hit and miss counts, number of entries and total size in bytes
+        """
+        entries = list(self._entries())
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries),
+        }
+
+
+def get_default_cache():
+    """
+    Get the cache configured by the ASCII_ART_CACHE_DIR environment variable.
+
+    ASCII_ART_CACHE_MAX_BYTES optionally overrides the size limit.
+
+    Returns:
+        RenderCache or None: The shared cache, or None if caching is not configured
+    """
+    global _default_cache
+
+    directory = os.environ.get('ASCII_ART_CACHE_DIR')
+    if not directory:
+        return None
+    if _default_cache is None or _default_cache.directory != directory:
+        max_bytes = int(os.environ.get('ASCII_ART_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES))
+        _default_cache = RenderCache(directory, max_bytes)
+    return _default_cache
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Render Service Module
+This module provides a local asyncio HTTP service exposing ASCII art generation and export.
+
+Endpoints:
+    GET  /health   -> "ok"
+    POST /art      {"text": ..., "pattern": "*", "width": 80} -> ASCII art as text/plain
+    POST /render   {"text": ..., "pattern": "*", "format": "png", "raster": false, "vector": false}
+                   -> encoded png/jpg/pdf/svg/ans bytes
+
+Rendering runs in a bounded process pool. Identical concurrent requests share one
+render, and once max_pending distinct renders are in flight new ones get
+503 Service Unavailable instead of queueing without bound.
+"""
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from ascii_art import ASCIIArt
+
+CONTENT_TYPES = {
+    'png': 'image/png',
+    'jpg': 'image/jpeg',
+    'pdf': 'application/pdf',
+    'svg': 'image/svg+xml',
+    'ans': 'text/plain; charset=utf-8',
+}
+MAX_BODY_BYTES = 1024 * 1024
+MAX_TEXT_LENGTH = 2000
+# Output grows with text length times pattern length, so patterns are one character as in the GUI
+MAX_PATTERN_LENGTH = 1
+MAX_HEADER_LINES = 100
+
+# Generator shared by all renders handled in one worker process
+_generator = None
+
+
+def render_art(text, pattern_char, width):
+    """Render ASCII art text for the /art endpoint. Runs inside a worker process."""
+    global _generator
+    if _generator is None:
+        _generator = ASCIIArt()
+    return ('\n'.join(_generator.iter_art(text, pattern_char, width=width)) + '\n').encode('utf-8')
+
+
+def render_export(text, pattern_char, fmt, raster, vector):
+    """Render and encode ASCII art for the /render endpoint. Runs inside a worker process."""
+    global _generator
+    if _generator is None:
+        _generator = ASCIIArt()
+    art_lines, _ = _generator.generate_art(text, pattern_char, max_length=None)
+
+    from image_export import export_ascii_art
+    return export_ascii_art(art_lines, pattern_char, fmt, raster=raster, vector=vector)
+
+
+class RequestError(Exception):
+    """Client error reported to the caller with an HTTP status."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class RenderService:
+    """Asyncio HTTP server offloading renders to a bounded, coalescing process pool."""
+
+    def __init__(self, workers=None, max_pending=64, max_text_length=MAX_TEXT_LENGTH):
+        """
+        Args:
+            workers (int, optional): Worker processes. Defaults to the CPU count.
+            max_pending (int, optional): Distinct renders in flight before new requests
+                are rejected with 503. Defaults to 64.
+            max_text_length (int, optional): Longest accepted text. Defaults to 2000.
+        """
+        self.workers = workers or os.cpu_count()
+        self.max_pending = max_pending
+        self.max_text_length = max_text_length
+        self.executor = None
+        # Render key -> future shared by every request waiting for that render
+        self._inflight = {}
+        self.coalesced = 0
+
+    async def render(self, key, func, *args):
+        """
+        Run a render in the process pool, sharing it with identical concurrent requests.
+
+        Args:
+            key (tuple): Identity of the render
+            func (callable): Worker function
+            *args: Worker function arguments
+
+        Returns:
+            bytes: Rendered output
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            if len(self._inflight) >= self.max_pending:
+                raise RequestError(HTTPStatus.SERVICE_UNAVAILABLE, "Too many renders in progress")
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.executor, func, *args)
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one disconnecting client does not cancel the render for the others
+        return await asyncio.shield(future)
+
+    def _parse_job(self, body):
+        """Validate a JSON request body and return (job dict, pattern)."""
+        try:
+            job = json.loads(body or b'{}')
+        except ValueError as e:
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {e}")
+        if not isinstance(job, dict) or not isinstance(job.get('text'), str):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Request requires a string 'text' field")
+        if len(job['text']) > self.max_text_length:
+            raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                               f"Text longer than {self.max_text_length} characters")
+        pattern = job.get('pattern') or '*'
+        if not isinstance(pattern, str) or len(pattern) > MAX_PATTERN_LENGTH:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "'pattern' must be a single character")
+        return job, pattern
+
+    @staticmethod
+    def _flag(job, name):
+        """Read an optional JSON boolean field of a job."""
+        value = job.get(name, False)
+        if not isinstance(value, bool):
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"'{name}' must be true or false")
+        return value
+
+    async def dispatch(self, method, path, body):
+        """
+        Route a request.
+
+        Returns:
+            tuple: (status, content type, body bytes)
+        """
+        if path == '/health' and method == 'GET':
+            return HTTPStatus.OK, 'text/plain; charset=utf-8', b'ok\n'
+
+        if path == '/art' and method == 'POST':
+            job, pattern = self._parse_job(body)
+            width = job.get('width', 80)
+            # bool is an int subclass, so JSON true/false would otherwise pass
+            if isinstance(width, bool) or not isinstance(width, int) or width < 1:
+                raise RequestError(HTTPStatus.BAD_REQUEST, "'width' must be a positive integer")
+            data = await self.render(('art', job['text'], pattern, width),
+                                     render_art, job['text'], pattern, width)
+            return HTTPStatus.OK, 'text/plain; charset=utf-8', data
+
+        if path == '/render' and method == 'POST':
+            job, pattern = self._parse_job(body)
+            fmt = str(job.get('format', 'png')).lower()
+            if fmt == 'jpeg':
+                fmt = 'jpg'
+            if fmt not in CONTENT_TYPES:
+                raise RequestError(HTTPStatus.BAD_REQUEST, f"Unsupported format: {fmt}")
+            raster, vector = self._flag(job, 'raster'), self._flag(job, 'vector')
+            data = await self.render(('render', job['text'], pattern, fmt, raster, vector),
+                                     render_export, job['text'], pattern, fmt, raster, vector)
+            return HTTPStatus.OK, CONTENT_TYPES[fmt], data
+
+        if path in ('/health', '/art', '/render'):
+            raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} not allowed on {path}")
+        raise RequestError(HTTPStatus.NOT_FOUND, f"No such endpoint: {path}")
+
+    async def _read_request(self, reader):
+        """Read one HTTP/1.1 request and return (method, path, body)."""
+        request_line = (await reader.readline()).decode('latin-1').split()
+        if len(request_line) != 3:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+        method, target, _ = request_line
+
+        headers = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = (await reader.readline()).decode('latin-1').strip()
+            if not line:
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise RequestError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Too many headers")
+
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+        if length < 0 or length > MAX_BODY_BYTES:
+            raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+        body = await reader.readexactly(length) if length else b''
+
+        return method.upper(), target.split('?', 1)[0], body
+
+    async def handle(self, reader, writer):
+        """Serve one request per connection."""
+        try:
+            try:
+                method, path, body = await self._read_request(reader)
+                status, content_type, data = await self.dispatch(method, path, body)
+            except RequestError as e:
+                status, content_type = e.status, 'application/json'
+                data = json.dumps({'error': str(e)}).encode('utf-8')
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return
+            except Exception as e:
+                status, content_type = HTTPStatus.INTERNAL_SERVER_ERROR, 'application/json'
+                data = json.dumps({'error': f"{type(e).__name__}: {e}"}).encode('utf-8')
+
+            head = [f"HTTP/1.1 {status.value} {status.phrase}",
+                    f"Content-Type: {content_type}",
+                    f"Content-Length: {len(data)}",
+                    "Connection: close"]
+            if status == HTTPStatus.SERVICE_UNAVAILABLE:
+                head.append("Retry-After: 1")
+            writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + data)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8080):
+        """Run the service until cancelled."""
+        with ProcessPoolExecutor(max_workers=self.workers) as self.executor:
+            server = await asyncio.start_server(self.handle, host, port)
+            async with server:
+                print(f"Serving ASCII art on http://{host}:{port}", flush=True)
+                await server.serve_forever()
+
+
+def run_service(args):
+    """Start the render service from parsed command line arguments."""
+    service = RenderService(workers=args.workers, max_pending=args.max_pending)
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
@@ -5,6 +5,17 @@
 
 # Get the absolute path of the directory this script is in
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+VENV_DIR="$SCRIPT_DIR/venv"
+REQUIREMENTS="$SCRIPT_DIR/requirements.txt"
+# Checksum of the requirements the virtual environment was last installed from
+REQUIREMENTS_STAMP="$VENV_DIR/.requirements.cksum"
+
+# Fast path: reuse a working virtual environment whose requirements are up to date
+if [ -x "$VENV_DIR/bin/python" ] && \
+   [ "$(cat "$REQUIREMENTS_STAMP" 2>/dev/null)" = "$(cksum < "$REQUIREMENTS")" ] && \
+   "$VENV_DIR/bin/python" -c "import tkinter" >/dev/null 2>&1; then
+    exec "$VENV_DIR/bin/python" "$SCRIPT_DIR/ascii_converter.py"
+fi
 
 # Find Python with tkinter support
 echo "Finding Python with tkinter support..."
@@ -39,18 +50,19 @@ if ! $PYTHON_CMD -c "import tkinter" &>/dev/null; then
     exit 1
 fi
 
-# Remove any existing virtual environment
-if [ -d "venv" ]; then
-    echo "Removing existing virtual environment..."
-    rm -rf venv
+# Reuse the existing virtual environment unless it lost tkinter support
+if [ -d "$VENV_DIR" ] && ! "$VENV_DIR/bin/python" -c "import tkinter" >/dev/null 2>&1; then
+    echo "Removing broken virtual environment..."
+    rm -rf "$VENV_DIR"
 fi
 
-# Create a fresh virtual environment with the Python that has tkinter
-echo "Creating virtual environment with $PYTHON_CMD..."
-$PYTHON_CMD -m venv venv
+if [ ! -d "$VENV_DIR" ]; then
+    echo "Creating virtual environment with $PYTHON_CMD..."
+    $PYTHON_CMD -m venv "$VENV_DIR"
+fi
 
 # Activate virtual environment
-source venv/bin/activate
+. "$VENV_DIR/bin/activate"
 
 # Verify tkinter still works in the virtual environment
 if ! python -c "import tkinter" &>/dev/null; then
@@ -61,10 +73,12 @@ if ! python -c "import tkinter" &>/dev/null; then
     exit 0
 fi
 
-# Install required packages
-echo "Installing required packages..."
-pip install -r requirements.txt
+# Install required packages only when requirements.txt changed since the last install
+if [ "$(cat "$REQUIREMENTS_STAMP" 2>/dev/null)" != "$(cksum < "$REQUIREMENTS")" ]; then
+    echo "Installing required packages..."
+    pip install -r "$REQUIREMENTS" && cksum < "$REQUIREMENTS" > "$REQUIREMENTS_STAMP"
+fi
 
 # Run the ASCII converter
 echo "Starting ASCII Converter..."
-python "$SCRIPT_DIR/ascii_converter.py"
\ No newline at end of file
+exec python "$SCRIPT_DIR/ascii_converter.py"
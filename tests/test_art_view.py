@@ -0,0 +1,23 @@
+import sys
+import pytest
+from ascii_art import ASCIIArt
+from art_view import ArtDocument
+
+
+@pytest.mark.parametrize('text, width', [('a~b', None), ('a~b' * 10, 40), ('Hello\n\nWorld é!', 30),
+                                         ('abc ~ def ~ ghi', 25)])
+def test_art_document_matches_iter_art(text, width):
+    generator = ASCIIArt()
+    document = ArtDocument(generator, text, '*', width)
+    expected = list(generator.iter_art(text, '*', width=width or sys.maxsize))
+    assert list(document.iter_lines()) == expected
+    assert document.line_count == len(expected)
+    assert document.width == max(len(line) for line in expected)
+
+
+def test_line_slice_matches_iter_art_columns():
+    generator = ASCIIArt()
+    document = ArtDocument(generator, 'a~b', '*')
+    for row, line in enumerate(generator.iter_art('a~b', '*')):
+        for start in range(len(line)):
+            assert document.line_slice(row, start, start + 4) == line[start:start + 4]
@@ -0,0 +1,94 @@
+import io
+import pytest
+from ascii_art import ART_PATTERNS, ASCIIArt, GlyphAtlas
+
+
+def test_generate_art_joins_glyphs_with_a_space():
+    generator = ASCIIArt()
+    lines, truncated = generator.generate_art('AB', '*')
+    assert not truncated
+    expected = [f"{a} {b}" for a, b in zip(generator.get_pattern('*', 'A'),
+                                             generator.get_pattern('*', 'B'))]
+    assert lines == expected
+
+
+def test_generate_art_truncates_to_max_length():
+    generator = ASCIIArt()
+    lines, truncated = generator.generate_art('x' * 20, '*', max_length=15)
+    assert truncated
+    assert lines == generator.generate_art('x' * 15, '*')[0]
+    assert not generator.generate_art('x' * 20, '*', max_length=None)[1]
+
+
+def test_resolve_falls_back_to_uppercase_and_base_letter():
+    atlas = GlyphAtlas(ART_PATTERNS)
+    assert atlas.resolve('a') == 'A'
+    assert atlas.resolve('é') == 'E'
+    assert atlas.resolve('一') is None
+
+
+def test_iter_art_matches_generate_art_for_short_text():
+    generator = ASCIIArt()
+    assert list(generator.iter_art('Hello', '*')) == generator.generate_art('Hello', '*')[0]
+
+
+def test_iter_art_wraps_to_width():
+    generator = ASCIIArt()
+    lines = list(generator.iter_art('abcdefghij' * 3, '*', width=40))
+    blocks = '\n'.join(lines).split('\n\n')
+    assert len(blocks) > 1
+    assert all(len(line) <= 40 for line in lines)
+    assert ''.join(lines).count('*') == ''.join(generator.render_rows('abcdefghij' * 3, '*')).count('*')
+
+
+def test_iter_art_starts_a_block_per_input_line():
+    generator = ASCIIArt()
+    lines = list(generator.iter_art('ab\ncd', '*'))
+    height = generator.atlas.height
+    assert lines[:height] == generator.render_rows('ab', '*')
+    assert lines[height] == ''
+    assert lines[height + 1:] == generator.render_rows('cd', '*')
+
+
+def test_iter_art_reads_file_objects_and_chunks():
+    generator = ASCIIArt()
+    expected = list(generator.iter_art('hello world', '*', width=30))
+    assert list(generator.iter_art(io.StringIO('hello world'), '*', width=30)) == expected
+    assert list(generator.iter_art(['hello ', 'world'], '*', width=30)) == expected
+
+
+def test_placeholder_rows_have_one_width():
+    generator = ASCIIArt()
+    for char in '~ß一':
+        assert len({len(row) for row in generator.atlas.placeholder(char)}) == 1
+    lines = generator.generate_art('a~b', '*')[0]
+    assert len({len(line) for line in lines}) == 1
+    assert all(len(line) <= 40 for line in generator.iter_art('a~b' * 10, '*', width=40))
+
+
+def test_art_patterns_are_read_only_and_glyphs_come_from_the_atlas():
+    generator = ASCIIArt()
+    with pytest.raises(TypeError):
+        generator.art_patterns['~'] = ['1']
+    assert generator.art_patterns['!'] == tuple(ART_PATTERNS['!'])
+    assert isinstance(generator.art_patterns['A'], tuple)
+    assert set(generator.art_patterns) == set(ART_PATTERNS)
+    with pytest.raises(KeyError):
+        generator.art_patterns['~']
+
+    custom = ASCIIArt(GlyphAtlas({**ART_PATTERNS, '~': ['     ', ' 1 1 ', '1 1  ']}))
+    assert custom.get_pattern('*', '~')[1] == ' * * '
+    assert custom.art_patterns['~'][:3] == ('     ', ' 1 1 ', '1 1  ')
+    assert '~' not in ART_PATTERNS and '~' not in generator.art_patterns
+
+
+@pytest.mark.parametrize('source', [io.BytesIO(b''), io.BytesIO(b'hello'), b'hello', [b'he', b'llo']])
+def test_iter_art_rejects_binary_input(source):
+    with pytest.raises(TypeError, match='must be text'):
+        list(ASCIIArt().iter_art(source, '*'))
+
+
+def test_iter_art_reads_wrapped_binary_streams():
+    generator = ASCIIArt()
+    stream = io.TextIOWrapper(io.BytesIO('héllo'.encode('utf-8')), encoding='utf-8')
+    assert list(generator.iter_art(stream, '*')) == list(generator.iter_art('héllo', '*'))
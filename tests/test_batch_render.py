@@ -0,0 +1,59 @@
+import json
+import os
+import pytest
+from ascii_art import ASCIIArt
+from batch_render import main, parse_job
+
+DEFAULTS = {'pattern': '*', 'format': 'png'}
+
+
+@pytest.mark.parametrize('line, filename, fmt', [
+    ('hello', None, 'png'),
+    ('{"text": "hi", "filename": "foo", "format": "pdf"}', 'foo.pdf', 'pdf'),
+    ('{"text": "hi", "filename": "foo.JPEG", "format": "jpg"}', 'foo.JPEG', 'jpg'),
+    ('{"text": "hi", "filename": "bar.svg"}', 'bar.svg', 'svg'),
+    ('{"text": "hi", "filename": "../up/v1.2", "format": "ans"}', 'v1.2.ans', 'ans'),
+])
+def test_parse_job_derives_the_filename_from_the_format(line, filename, fmt):
+    job = parse_job(line, DEFAULTS)
+    assert (job['filename'], job['format']) == (filename, fmt)
+
+
+@pytest.mark.parametrize('line', ['{"text": "hi", "filename": "bar.png", "format": "jpg"}',
+                                  '{"text": "hi", "format": "bmp"}', '{"filename": "x.png"}', '{oops'])
+def test_parse_job_rejects_bad_jobs(line):
+    with pytest.raises(ValueError):
+        parse_job(line, DEFAULTS)
+
+
+def test_render_command_reports_jobs_in_order(tmp_path, capsys, monkeypatch):
+    monkeypatch.delenv('ASCII_ART_CACHE_DIR', raising=False)
+    jobs = tmp_path / 'jobs.jsonl'
+    jobs.write_text('\n'.join([
+        'hello',
+        '{"text": "hi", "filename": "foo", "format": "pdf"}',
+        '{"text": "hi", "filename": "bar.png", "format": "jpg"}',
+        '{"text": "yo", "filename": "baz.svg", "pattern": "#"}',
+        '{"text": "x", "format": "bmp"}',
+    ]) + '\n', encoding='utf-8')
+    output = tmp_path / 'out'
+
+    assert main(['render', str(jobs), '-o', str(output), '-w', '2', '--chunksize', '1']) == 1
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert [result['job'] for result in results] == [0, 1, 2, 3, 4]
+    assert [result['ok'] for result in results] == [True, True, False, True, False]
+    assert 'does not match format' in results[2]['error']
+    assert 'Unsupported format' in results[4]['error']
+    signatures = {'ascii_art_000000.png': b'\x89PNG', 'foo.pdf': b'%PDF', 'baz.svg': b'<svg'}
+    assert sorted(os.listdir(output)) == sorted(signatures)
+    for name, signature in signatures.items():
+        assert (output / name).read_bytes().startswith(signature)
+
+
+def test_text_command_streams_wrapped_art(tmp_path, capsys):
+    source = tmp_path / 'input.txt'
+    source.write_text('hello world\nagain', encoding='utf-8')
+    assert main(['text', str(source), '--pattern', '#', '--width', '30']) == 0
+    expected = list(ASCIIArt().iter_art('hello world\nagain', '#', width=30))
+    assert capsys.readouterr().out.splitlines() == expected
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+from ascii_art import ART_PATTERNS, ASCIIArt
+from bitmap_engine import BitmapEngine
+from image_export import _cell_size, get_font, mask_to_image
+
+
+@pytest.mark.parametrize('text', ['HELLO, WORLD!', 'hello (world) 2026?', ''.join(sorted(ART_PATTERNS)), 'Émile'])
+def test_render_lines_matches_generate_art(text):
+    assert BitmapEngine().render_lines(text, '*') == ASCIIArt().generate_art(text, '*', None)[0]
+
+
+def test_unknown_characters_render_as_hollow_box():
+    engine = BitmapEngine()
+    mask = engine.render_mask('~')
+    assert mask.shape == (engine.height, engine.width)
+    assert mask[[0, -1]].all() and mask[:, [0, -1]].all()
+    assert not mask[1:-1, 1:-1].any()
+
+
+def test_render_lines_requires_a_single_pattern_character():
+    with pytest.raises(ValueError):
+        BitmapEngine().render_lines('A', '**')
+
+
+def test_mask_to_image_size():
+    mask = np.zeros((3, 7), dtype=bool)
+    mask[1, 2] = True
+    cell_width, cell_height = _cell_size(get_font(12))
+    img = mask_to_image(mask, '*', font_size=12, padding=4)
+    assert img.size == (7 * cell_width + 8, 3 * cell_height + 8)
+    # Only the set cell is drawn
+    assert img.crop((4, 4, 4 + 2 * cell_width, 4 + 3 * cell_height)).getextrema() == ((255, 255),) * 3
@@ -0,0 +1,65 @@
+import pytest
+from ascii_art import ASCIIArt
+from compact_art import CompactArt
+
+
+@pytest.mark.parametrize('text, pattern', [('Hello, World!', '*'), ('a~b', '#'), ('HI', '@@'), ('', '*')])
+def test_from_text_matches_from_lines(text, pattern):
+    generator = ASCIIArt()
+    lines = generator.render_rows(text, pattern)
+    compact = CompactArt.from_text(text, pattern, generator)
+    assert compact == CompactArt.from_lines(lines, pattern)
+    assert compact.to_lines() == lines
+
+
+@pytest.mark.parametrize('text', ['Hello ~ World', 'W' * 12000, 'a~b~c'])
+def test_bytes_round_trip(text):
+    compact = CompactArt.from_text(text, '*')
+    decoded = CompactArt.from_bytes(compact.to_bytes())
+    assert decoded == compact
+    assert decoded.to_lines() == compact.to_lines()
+    assert (decoded.width, decoded.height) == (compact.width, compact.height)
+
+
+@pytest.mark.parametrize('text', ['Hello, World! ~ ' * 700, 'W' * 12000])
+def test_encoding_is_smaller_than_the_text(text):
+    lines = ASCIIArt().render_rows(text, '*')
+    text_bytes = sum(len(line.encode('utf-8')) for line in lines)
+    compact = CompactArt.from_text(text, '*')
+    # One bit per cell, plus the placeholder overlay
+    assert len(compact.to_bytes()) < text_bytes / 4
+    assert len(compact.bits) + compact.line_lengths.itemsize * compact.height < text_bytes / 4
+
+
+def test_iter_runs_yields_pattern_runs_and_literals_in_order():
+    compact = CompactArt.from_lines(['** (1) *', '', ' ***'], '*')
+    assert list(compact.iter_runs(0)) == [(0, 2, None), (3, 3, '(1)'), (7, 1, None)]
+    assert list(compact.iter_runs(1)) == []
+    assert list(compact.iter_runs(2)) == [(1, 3, None)]
+    assert compact.row_contains(0, '*') and not compact.row_contains(1, '*')
+    assert compact.row_contains(0, '(') and not compact.row_contains(2, '(')
+
+
+def test_from_bytes_rejects_bad_data():
+    data = CompactArt.from_text('abc', '*').to_bytes()
+    with pytest.raises(ValueError):
+        CompactArt.from_bytes(data[:len(data) // 2])
+    with pytest.raises(ValueError):
+        CompactArt.from_bytes(b'XXXX' + data[4:])
+
+
+def test_rows_takes_a_band_of_lines():
+    lines = list(ASCIIArt().iter_art('ab\n~c\nde', '*'))
+    compact = CompactArt.from_lines(lines, '*')
+    assert compact.rows(3, 9).to_lines() == lines[3:9]
+    assert compact.rows(5, 5).to_lines() == []
+
+
+def test_from_lines_does_not_cache_art_lines():
+    from compact_art import _glyph_row_cells
+
+    _glyph_row_cells.cache_clear()
+    CompactArt.from_lines(ASCIIArt().render_rows('Hello', '*'), '*')
+    assert _glyph_row_cells.cache_info().currsize == 0
+    CompactArt.from_text('Hello', '*')
+    assert _glyph_row_cells.cache_info().currsize > 0
@@ -0,0 +1,81 @@
+import json
+import os
+import pytest
+from ascii_art import ASCIIArt
+from glyph_fonts import FIGLET_REQUIRED_CODES, FontError, load_font, parse_flf, parse_json_font
+
+
+def _figlet_font(height=2, extra='', empty=()):
+    """
+    Build a FIGlet font whose glyphs are a bar as wide as (code % 3) + 1, with '$' hardblanks.
+
+    Characters in empty get empty FIGcharacters, which are only endmarks.
+    """
+    lines = [f'flf2a$ {height} {height} 10 0 1', 'test font']
+    for code in FIGLET_REQUIRED_CODES:
+        width = 0 if chr(code) in empty else code % 3 + 1
+        rows = ['#' * width] + ['$' * width] * (height - 1)
+        lines += [row + '@' for row in rows[:-1]] + [rows[-1] + '@@']
+    return '\n'.join(lines) + '\n' + extra
+
+
+def test_parse_flf_reads_required_and_code_tagged_glyphs():
+    height, patterns = parse_flf(_figlet_font(extra='0x263A  SMILE\n:)@\n$$@@\n'))
+    assert height == 2
+    assert patterns['A'] == ['1' * (ord('A') % 3 + 1), ' ' * (ord('A') % 3 + 1)]
+    assert patterns['☺'] == ['11', '  ']
+
+
+@pytest.mark.parametrize('text', ['', 'not a font', 'flf2a$ x 1 1 0 0'])
+def test_parse_flf_rejects_bad_headers(text):
+    with pytest.raises(FontError):
+        parse_flf(text)
+
+
+def test_parse_flf_rejects_truncated_glyphs():
+    with pytest.raises(FontError):
+        parse_flf(_figlet_font(extra='65\n#@@\n'))
+
+
+def test_parse_json_font():
+    height, patterns = parse_json_font(json.dumps({'glyphs': {'A': ['#.#', ' # ']}}))
+    assert height == 2
+    assert patterns['A'] == ['111', ' 1 ']
+
+
+@pytest.mark.parametrize('font', ['{', '[]', '{"glyphs": {}}', '{"glyphs": {"AB": ["1"]}}',
+                                  '{"glyphs": {"A": "1"}}', '{"height": -1, "glyphs": {"A": ["1"]}}'])
+def test_parse_json_font_rejects_bad_fonts(font):
+    with pytest.raises(FontError):
+        parse_json_font(font)
+
+
+def test_load_font_compiles_and_reuses_the_cache(tmp_path):
+    font_path = tmp_path / 'test.flf'
+    font_path.write_text(_figlet_font(height=3), encoding='latin-1')
+    cache_dir = tmp_path / 'cache'
+
+    uncached = load_font(str(font_path), use_cache=False)
+    first = load_font(str(font_path), cache_dir=str(cache_dir))
+    cache_files = os.listdir(cache_dir)
+    assert len(cache_files) == 1 and cache_files[0].endswith('.glyphs')
+
+    second = load_font(str(font_path), cache_dir=str(cache_dir))
+    assert os.listdir(cache_dir) == cache_files
+    for atlas in (first, second, load_font(str(cache_dir / cache_files[0]))):
+        assert atlas.height == 3
+        assert dict(atlas.glyphs) == uncached.glyphs
+
+    art = ASCIIArt(second).generate_art('AB', '*')[0]
+    assert art == ASCIIArt(uncached).generate_art('AB', '*')[0]
+
+
+def test_cached_font_with_empty_glyphs(tmp_path):
+    font_path = tmp_path / 'deutsch.flf'
+    font_path.write_text(_figlet_font(height=3, empty='ÄÖÜäöüß'), encoding='latin-1')
+
+    uncached = load_font(str(font_path), use_cache=False)
+    cached = load_font(str(font_path), cache_dir=str(tmp_path / 'cache'))
+    assert cached.glyphs['Ä'] == (0, (0, 0, 0))
+    assert dict(cached.glyphs) == uncached.glyphs
+    assert ASCIIArt(cached).generate_art('AÄ', '*')[0] == ASCIIArt(uncached).generate_art('AÄ', '*')[0]
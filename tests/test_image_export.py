@@ -0,0 +1,137 @@
+import io
+import os
+import pytest
+from PIL import Image, ImageChops
+from ascii_art import ASCIIArt
+from compact_art import CompactArt
+from image_export import ascii_to_image, ascii_to_image_parallel, export_ascii_art
+
+
+def _same_image(first, second):
+    return first.size == second.size and ImageChops.difference(first, second).getbbox() is None
+
+
+@pytest.fixture(scope='module')
+def art_lines():
+    return list(ASCIIArt().iter_art('Hello, World! ~ ' * 30, '*', width=120))
+
+
+def test_parallel_raster_matches_serial(art_lines):
+    serial = ascii_to_image(art_lines, '*', raster=True)
+    parallel = ascii_to_image_parallel(art_lines, '*', workers=2, band_lines=7)
+    assert _same_image(serial, parallel)
+
+
+def test_parallel_raster_matches_serial_for_compact_art(art_lines):
+    serial = ascii_to_image(art_lines, '*', raster=True)
+    compact = CompactArt.from_lines(art_lines, '*')
+    assert _same_image(serial, ascii_to_image(compact, '*', raster=True))
+    assert _same_image(serial, ascii_to_image_parallel(compact, '*', workers=2, band_lines=10))
+
+
+@pytest.mark.parametrize('fmt, signature', [('png', b'\x89PNG'), ('jpg', b'\xff\xd8'),
+                                            ('pdf', b'%PDF'), ('svg', b'<svg'), ('ans', b'\x1b[')])
+def test_export_formats(art_lines, fmt, signature):
+    assert export_ascii_art(art_lines[:5], '*', fmt).startswith(signature)
+
+
+def test_export_writes_into_buffer(art_lines):
+    buffer = io.BytesIO()
+    assert export_ascii_art(art_lines[:5], '*', 'png', buffer=buffer) is buffer
+    assert Image.open(io.BytesIO(buffer.getvalue())).format == 'PNG'
+
+
+def test_export_rejects_unknown_formats(art_lines):
+    with pytest.raises(ValueError):
+        export_ascii_art(art_lines, '*', 'bmp')
+
+
+class _Stream(io.RawIOBase):
+    """Write-only stream that cannot seek, like a socket file."""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.data += data
+        return len(data)
+
+
+@pytest.mark.parametrize('fmt, signature', [('pdf', b'%PDF'), ('png', b'\x89PNG'), ('svg', b'<svg')])
+def test_export_writes_into_non_seekable_stream(art_lines, fmt, signature):
+    stream = _Stream()
+    export_ascii_art(art_lines[:5], '*', fmt, buffer=stream)
+    assert bytes(stream.data).startswith(signature)
+
+
+def test_save_recreates_a_deleted_folder(tmp_path, monkeypatch, art_lines):
+    import shutil
+    from image_export import save_ascii_art_image, save_ascii_art_tiles
+
+    monkeypatch.delenv('ASCII_ART_CACHE_DIR', raising=False)
+    folder = tmp_path / 'exports'
+    save_ascii_art_image(art_lines[:5], '*', filename='a.svg', download_folder=str(folder))
+    shutil.rmtree(folder)
+    assert os.path.exists(save_ascii_art_image(art_lines[:5], '*', filename='b.svg',
+                                               download_folder=str(folder)))
+    shutil.rmtree(folder)
+    assert os.path.exists(save_ascii_art_tiles(art_lines[:5], '*', filename='c.pdf',
+                                               download_folder=str(folder)))
+
+
+@pytest.mark.parametrize('filename', ['empty.pdf', 'empty.tif', 'empty'])
+def test_save_tiles_of_empty_art_writes_a_message_tile(tmp_path, filename):
+    from image_export import save_ascii_art_tiles
+
+    path = save_ascii_art_tiles(['', 'Text was truncated'], '*', filename=filename,
+                                download_folder=str(tmp_path))
+    assert os.path.exists(path)
+    if os.path.isdir(path):
+        assert os.listdir(path) == ['tile_0000_0000.png']
+
+
+def test_column_tiles_keep_the_color_of_the_full_line(tmp_path):
+    from image_export import save_ascii_art_tiles
+
+    lines = ['XXXX!', 'XXXXX']
+    folder = save_ascii_art_tiles(lines, 'X', filename='tiles', download_folder=str(tmp_path),
+                                  columns_per_tile=2)
+    first_tile = Image.open(os.path.join(folder, 'tile_0000_0000.png')).convert('RGB')
+    colors = [color for _, color in first_tile.getcolors(first_tile.width * first_tile.height)]
+    # Anti-aliased glyphs: red ink shows as pixels with far more red than green
+    assert any(red - green > 100 for red, green, _ in colors)
+
+
+def test_cached_svg_export_does_not_import_pillow(tmp_path):
+    import subprocess
+    import sys
+
+    script = ("import sys; from image_export import save_ascii_art_image; "
+              f"save_ascii_art_image(['* *'], '*', filename='art.svg', download_folder={str(tmp_path)!r}); "
+              "print('PIL' in sys.modules)")
+    environment = dict(os.environ, ASCII_ART_CACHE_DIR=str(tmp_path / 'cache'))
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), env=environment)
+    assert result.stdout.strip() == 'False'
+    assert os.listdir(tmp_path / 'cache')
+
+
+def test_pdf_tiles_write_one_page_per_tile_in_linear_size(tmp_path):
+    from PIL.PdfParser import PdfParser
+    from image_export import save_ascii_art_tiles
+
+    sizes = {}
+    for pages in (10, 60):
+        path = save_ascii_art_tiles(['* * *'] * (pages * 4), '*', filename=f'{pages}.pdf',
+                                    download_folder=str(tmp_path), lines_per_tile=4)
+        pdf = PdfParser(path)
+        try:
+            assert len(pdf.pages) == pages
+        finally:
+            pdf.close()
+        sizes[pages] = os.path.getsize(path)
+    # Appending page by page rewrites the page tree each time and grows quadratically
+    assert sizes[60] < 6 * sizes[10] * 1.2
@@ -0,0 +1,58 @@
+import io
+import numpy as np
+import pytest
+from PIL import Image
+from image_to_ascii import DEFAULT_RAMP, grid_size, image_to_ascii, iter_image_ascii, luminance_to_lines
+
+
+def _gradient(width=256, height=64):
+    """Horizontal gradient from black to white."""
+    return np.tile(np.linspace(0, 255, width), (height, 1)).astype(np.uint8)
+
+
+def test_luminance_maps_to_the_ramp():
+    luminance = np.array([[0, 127, 128, 255]], dtype=np.uint8)
+    assert luminance_to_lines(luminance, 'ab') == ['aabb']
+    assert luminance_to_lines(np.array([[0, 255]], dtype=np.uint8)) == [DEFAULT_RAMP[0] + DEFAULT_RAMP[-1]]
+    with pytest.raises(ValueError):
+        luminance_to_lines(luminance, '')
+
+
+@pytest.mark.parametrize('size, columns, expected', [((200, 100), 80, (80, 20)), ((100, 400), 50, (50, 100)),
+                                                     ((10, 10), 80, (10, 5)), ((1000, 1), 40, (40, 1))])
+def test_grid_keeps_the_aspect_ratio(size, columns, expected):
+    assert grid_size(size, columns) == expected
+
+
+def test_gradient_runs_through_the_ramp():
+    lines = image_to_ascii(Image.fromarray(_gradient()), columns=len(DEFAULT_RAMP))
+    assert len(lines) == 2
+    assert lines[0] == DEFAULT_RAMP
+    inverted = image_to_ascii(Image.fromarray(_gradient()), columns=len(DEFAULT_RAMP), invert=True)
+    assert inverted[0] == DEFAULT_RAMP[::-1]
+
+
+def test_strips_match_the_whole_image():
+    rng = np.random.default_rng(0)
+    img = Image.fromarray(rng.integers(0, 256, (317, 411, 3), dtype=np.uint8), 'RGB')
+    whole = list(iter_image_ascii(img, columns=97, strip_rows=10_000))
+    assert len(whole) == grid_size(img.size, 97)[1]
+    assert list(iter_image_ascii(img, columns=97, strip_rows=7)) == whole
+
+
+@pytest.mark.parametrize('mode', ['I;16', 'I', 'F'])
+def test_high_depth_grayscale_is_scaled_to_8_bits(mode):
+    gradient = _gradient().astype(np.float64) / 255
+    values = {'I;16': (gradient * 65535).astype(np.uint16), 'I': (gradient * 65535).astype(np.int32),
+              'F': gradient.astype(np.float32)}[mode]
+    img = Image.fromarray(values)
+    assert img.mode == mode
+    expected = image_to_ascii(Image.fromarray(_gradient()), columns=len(DEFAULT_RAMP))
+    assert image_to_ascii(img, columns=len(DEFAULT_RAMP)) == expected
+
+
+def test_reads_16_bit_png_files():
+    buffer = io.BytesIO()
+    Image.fromarray((_gradient().astype(np.uint32) * 257).astype(np.uint16)).save(buffer, 'PNG')
+    buffer.seek(0)
+    assert image_to_ascii(buffer, columns=len(DEFAULT_RAMP))[0] == DEFAULT_RAMP
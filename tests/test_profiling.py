@@ -0,0 +1,45 @@
+import profiling
+from ascii_art import ASCIIArt
+from image_export import export_ascii_art
+
+
+def test_profile_records_pipeline_stages():
+    lines = ASCIIArt().generate_art('Hello!', '*')[0]
+    with profiling.profile(trace_memory=False):
+        export_ascii_art(lines, '*', 'png', raster=True)
+    assert not profiling.is_enabled()
+
+    summary = profiling.summary()
+    assert {'font_load', 'draw', 'encode'} <= set(summary)
+    for totals in summary.values():
+        assert totals['calls'] >= 1
+        assert totals['max_ms'] <= totals['total_ms']
+
+    events = profiling.chrome_trace()['traceEvents']
+    assert {event['name'] for event in events} == set(summary)
+    assert all(event['ph'] == 'X' and event['dur'] >= 0 for event in events)
+
+
+def test_stage_is_a_no_op_while_disabled():
+    profiling.reset()
+    with profiling.stage('ignored'):
+        pass
+    assert profiling.summary() == {}
+
+
+def test_peak_bytes_counts_memory_freed_inside_the_stage():
+    with profiling.profile():
+        with profiling.stage('outer'):
+            with profiling.stage('inner'):
+                buffer = bytearray(4 * 1024 * 1024)
+                del buffer
+            with profiling.stage('after'):
+                pass
+    summary = profiling.summary()
+    assert summary['inner']['peak_bytes'] >= 4 * 1024 * 1024
+    # The inner peak also counts for the enclosing stage, not for later siblings
+    assert summary['outer']['peak_bytes'] >= 4 * 1024 * 1024
+    assert summary['after']['peak_bytes'] < 1024 * 1024
+    events = profiling.chrome_trace()['traceEvents']
+    assert [event['name'] for event in events] == ['inner', 'after', 'outer']
+    assert all('peak_bytes' in event['args'] for event in events)
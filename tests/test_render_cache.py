@@ -0,0 +1,113 @@
+import os
+from render_cache import RenderCache
+
+
+def _export(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+    return str(path)
+
+
+def test_key_depends_on_art_pattern_and_parameters():
+    key = RenderCache.key(['a', 'b'], '*', extension='.png')
+    assert key == RenderCache.key(['a', 'b'], '*', extension='.png')
+    assert key != RenderCache.key(['a', 'c'], '*', extension='.png')
+    assert key != RenderCache.key(['a', 'b'], '#', extension='.png')
+    assert key != RenderCache.key(['a', 'b'], '*', extension='.jpg')
+    assert key != RenderCache.key(['ab'], '*', extension='.png')
+
+
+def test_fetch_misses_then_hits(tmp_path):
+    cache = RenderCache(tmp_path / 'cache')
+    key = RenderCache.key(['art'], '*')
+    destination = str(tmp_path / 'out.png')
+
+    assert not cache.fetch(key, destination)
+    cache.store(key, _export(destination, b'rendered'))
+    os.remove(destination)
+
+    assert cache.fetch(key, destination)
+    with open(destination, 'rb') as f:
+        assert f.read() == b'rendered'
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'entries': 1, 'bytes': len(b'rendered')}
+
+
+def test_evicts_least_recently_used_entries(tmp_path):
+    cache = RenderCache(tmp_path / 'cache', max_bytes=250)
+    keys = [RenderCache.key([str(index)], '*') for index in range(3)]
+    for index, key in enumerate(keys[:2]):
+        cache.store(key, _export(tmp_path / 'out.png', bytes(100)))
+        # Distinct, increasing modification times
+        entry = cache._path(key, 'out.png')
+        os.utime(entry, (index, index))
+
+    # Using the first entry makes the second one the least recently used
+    assert cache.fetch(keys[0], str(tmp_path / 'hit.png'))
+    cache.store(keys[2], _export(tmp_path / 'out.png', bytes(100)))
+
+    assert cache.fetch(keys[0], str(tmp_path / 'a.png'))
+    assert not cache.fetch(keys[1], str(tmp_path / 'b.png'))
+    assert cache.fetch(keys[2], str(tmp_path / 'c.png'))
+    assert cache.stats()['bytes'] <= 250
+
+
+def test_clear_removes_every_entry(tmp_path):
+    cache = RenderCache(tmp_path / 'cache')
+    cache.store(RenderCache.key(['x'], '*'), _export(tmp_path / 'out.svg', b'<svg/>'))
+    cache.clear()
+    assert cache.stats()['entries'] == 0
+
+
+def test_store_replacing_an_entry_counts_it_once(tmp_path):
+    cache = RenderCache(tmp_path / 'cache')
+    key = RenderCache.key(['x'], '*')
+    for _ in range(3):
+        cache.store(key, _export(tmp_path / 'out.png', bytes(100)))
+    assert cache._total_bytes == 100
+    assert cache.fetch(key, str(tmp_path / 'hit.png'))
+
+
+def test_saving_over_a_cached_export_keeps_the_cache_entry(tmp_path):
+    from image_export import save_ascii_art_image
+
+    cache = RenderCache(tmp_path / 'cache')
+    folder = str(tmp_path / 'out')
+
+    def save(text, filename):
+        path = save_ascii_art_image([text], '*', filename=filename, download_folder=folder, cache=cache)
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+
+    save('AAA', 'x.svg')
+    save('AAA', 'x.svg')  # cache hit, linked to the cache entry
+    assert 'BBB' in save('BBB', 'x.svg')
+    assert 'AAA' in save('AAA', 'y.svg')
+    assert cache.hits == 2
+
+
+def test_entry_evicted_during_fetch_is_a_miss(tmp_path, monkeypatch):
+    import shutil
+
+    cache = RenderCache(tmp_path / 'cache')
+    key = RenderCache.key(['art'], '*')
+    cache.store(key, _export(tmp_path / 'out.png', b'rendered'))
+    entry = cache._path(key, 'out.png')
+
+    # Another process evicts the entry between the recency update and the link
+    def evicting_link(source, destination):
+        os.remove(entry)
+        raise FileNotFoundError(source)
+
+    monkeypatch.setattr(os, 'link', evicting_link)
+    assert not cache.fetch(key, str(tmp_path / 'out.png'))
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    # Without hardlink support the copy fallback can race the same way
+    cache.store(key, _export(tmp_path / 'out.png', b'rendered'))
+    def unsupported_link(source, destination):
+        raise OSError("hardlinks not supported")
+
+    monkeypatch.setattr(os, 'link', unsupported_link)
+    monkeypatch.setattr(shutil, 'copyfile', evicting_link)
+    assert not cache.fetch(key, str(tmp_path / 'out.png'))
+    assert (cache.hits, cache.misses) == (0, 2)
@@ -0,0 +1,55 @@
+import asyncio
+from http import HTTPStatus
+import pytest
+from ascii_art import ASCIIArt
+from render_service import RenderService, RequestError
+
+
+def _dispatch(path, body, method='POST'):
+    return asyncio.run(RenderService().dispatch(method, path, body))
+
+
+def test_art_endpoint_renders_wrapped_art():
+    status, _, data = _dispatch('/art', b'{"text": "hello", "pattern": "#", "width": 30}')
+    assert status == HTTPStatus.OK
+    assert data.decode('utf-8') == '\n'.join(ASCIIArt().iter_art('hello', '#', width=30)) + '\n'
+
+
+@pytest.mark.parametrize('width', ['true', 'false', '0', '-3', '2.5', '"80"'])
+def test_art_endpoint_rejects_bad_widths(width):
+    with pytest.raises(RequestError) as error:
+        _dispatch('/art', f'{{"text": "hello", "width": {width}}}'.encode())
+    assert error.value.status == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.parametrize('path, body, status', [
+    ('/art', b'{', HTTPStatus.BAD_REQUEST),
+    ('/art', b'{"text": 5}', HTTPStatus.BAD_REQUEST),
+    ('/render', b'{"text": "a", "format": "bmp"}', HTTPStatus.BAD_REQUEST),
+    ('/nowhere', b'', HTTPStatus.NOT_FOUND),
+])
+def test_bad_requests(path, body, status):
+    with pytest.raises(RequestError) as error:
+        _dispatch(path, body)
+    assert error.value.status == status
+
+
+@pytest.mark.parametrize('body', [b'{"text": "hi", "pattern": "**"}', b'{"text": "hi", "pattern": 7}',
+                                  b'{"text": "hi", "raster": "false"}', b'{"text": "hi", "vector": 1}'])
+def test_render_endpoint_rejects_bad_options(body):
+    with pytest.raises(RequestError) as error:
+        _dispatch('/render', body)
+    assert error.value.status == HTTPStatus.BAD_REQUEST
+
+
+def test_art_endpoint_rejects_long_patterns():
+    with pytest.raises(RequestError) as error:
+        _dispatch('/art', b'{"text": "hi", "pattern": "' + b'#' * 2000 + b'"}')
+    assert error.value.status == HTTPStatus.BAD_REQUEST
+
+
+def test_render_endpoint_accepts_boolean_flags():
+    status, content_type, data = _dispatch('/render', b'{"text": "hi", "format": "svg", "raster": false, '
+                                                      b'"vector": true}')
+    assert (status, content_type) == (HTTPStatus.OK, 'image/svg+xml')
+    assert data.startswith(b'<svg')
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Vector Export Module
+This module provides functionality to export ASCII art as text-native formats
+(SVG, PDF with real text, ANSI-colored terminal output) without rasterization.
+"""
+import zlib
+from xml.sax.saxutils import escape
+from constants import COLORS
+from image_export import filter_art_lines, line_color
+
+# Courier glyphs are 0.6 em wide; lines are spaced 1.2 em apart
+CHAR_WIDTH_EM = 0.6
+LINE_HEIGHT_EM = 1.2
+
+
+def _art_lines(ascii_lines):
+    """Return the exportable lines of ASCII art, as ascii_to_image would draw them."""
+    return list(filter_art_lines(ascii_lines)) or ["No ASCII art to export"]
+
+
+def _hex_to_rgb(color):
+    """Convert a '#RRGGBB' color to an (r, g, b) tuple of integers."""
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+
+def ascii_to_svg(ascii_lines, font_size=12, padding=5):
+    """
+    Convert ASCII art to an SVG document with one <text> element per line.
+
+    Args:
+        ascii_lines (list): Lines of ASCII art
+        font_size (int): Size of the font (matches UI font size)
+        padding (int): Padding around the text (matches UI padding)
+
+    Returns:
+        str: SVG document
+    """
+    art_lines = _art_lines(ascii_lines)
+    line_height = font_size * LINE_HEIGHT_EM
+    width = max(len(line) for line in art_lines) * font_size * CHAR_WIDTH_EM + padding * 2
+    height = len(art_lines) * line_height + padding * 2
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:g}" height="{height:g}" '
+        f'viewBox="0 0 {width:g} {height:g}">',
+        f'<rect width="100%" height="100%" fill="{COLORS["bg"]}"/>',
+        f'<g font-family="Courier, \'Courier New\', monospace" font-size="{font_size}" '
+        f'xml:space="preserve" style="white-space:pre">',
+    ]
+    for index, line in enumerate(art_lines):
+        # Baseline sits one font size below the top of the line box
+        y_position = padding + index * line_height + font_size
+        parts.append(f'<text x="{padding}" y="{y_position:g}" fill="{line_color(line)}">'
+                     f'{escape(line)}</text>')
+    parts.append('</g></svg>\n')
+
+    return '\n'.join(parts)
+
+
+def ascii_to_pdf(ascii_lines, font_size=12, padding=5):
+    """
+    Convert ASCII art to a single-page PDF that draws the art as real text.
+
+    The document uses the standard Courier font every PDF viewer provides, so
+    nothing is embedded or rasterized. Characters outside Windows-1252 are
+    written as '?'.
+
+    Args:
+        ascii_lines (list): Lines of ASCII art
+        font_size (int): Size of the font in points (matches UI font size)
+        padding (int): Padding around the text in points (matches UI padding)
+
+    Returns:
+        bytes: PDF document
+    """
+    art_lines = _art_lines(ascii_lines)
+    leading = font_size * LINE_HEIGHT_EM
+    width = max(len(line) for line in art_lines) * font_size * CHAR_WIDTH_EM + padding * 2
+    height = len(art_lines) * leading + padding * 2
+
+    def rgb(color):
+        return ' '.join(f'{channel / 255:g}' for channel in _hex_to_rgb(color))
+
+    content = [f'{rgb(COLORS["bg"])} rg 0 0 {width:g} {height:g} re f',
+               f'BT /F1 {font_size} Tf {leading:g} TL {padding} {height - padding - font_size:g} Td']
+    current_color = None
+    for line in art_lines:
+        color = line_color(line)
+        if color != current_color:
+            content.append(f'{rgb(color)} rg')
+            current_color = color
+        text = line.encode('cp1252', errors='replace')
+        text = text.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+        content.append(f"({text.decode('latin-1')}) Tj T*")
+    content.append('ET')
+    stream = zlib.compress('\n'.join(content).encode('latin-1'))
+
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width:g} {height:g}] '
+        f'/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>'.encode('latin-1'),
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Courier /Encoding /WinAnsiEncoding >>',
+        f'<< /Length {len(stream)} /Filter /FlateDecode >>\nstream\n'.encode('latin-1')
+        + stream + b'\nendstream',
+    ]
+
+    pdf = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += f'{number} 0 obj\n'.encode('latin-1') + body + b'\nendobj\n'
+    xref_offset = len(pdf)
+    pdf += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode('latin-1')
+    pdf += ''.join(f'{offset:010d} 00000 n \n' for offset in offsets).encode('latin-1')
+    pdf += (f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n'
+            f'startxref\n{xref_offset}\n%%EOF\n').encode('latin-1')
+
+    return bytes(pdf)
+
+
+def ascii_to_ansi(ascii_lines):
+    """
+    Convert ASCII art to text colored with ANSI escape codes for terminals.
+
+    Lines with special characters use the accent color (24-bit escape code);
+    other lines keep the terminal's own text color so they stay readable on
+    dark and light terminals alike.
+
+    Args:
+        ascii_lines (list): Lines of ASCII art
+
+    Returns:
+        str: ANSI-colored text
+    """
+    accent = '\x1b[38;2;{};{};{}m'.format(*_hex_to_rgb(COLORS['accent']))
+    reset = '\x1b[0m'
+
+    output = []
+    for line in _art_lines(ascii_lines):
+        if line_color(line) == COLORS['accent']:
+            output.append(f'{accent}{line}{reset}')
+        else:
+            output.append(line)
+
+    return '\n'.join(output) + '\n'